@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import tempfile
@@ -5,15 +6,16 @@ import traceback
 from pathlib import Path
 
 # このファイルは、Vercel(Serverless)上でFlaskアプリを起動するためのエントリポイントです。
-# デプロイ環境のパスや一時ディレクトリ(/tmp)を先に設定してから、`web_html_editor.py` の `app` を読み込みます。
+# デプロイ環境のパスや一時ディレクトリ(/tmp)を先に設定し、`web_html_editor.py` の `app` は
+# 最初のリクエスト時に読み込みます（コールドスタート時のインポートコストを削減するため）。
 
 # 環境変数を最初に設定（Vercel環境であることを示す）
 os.environ['VERCEL'] = '1'
 
 # プロジェクトルートをパスに追加
+# 重複していても先頭で一致するだけなので、sys.pathの走査による存在チェックは行わない
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+sys.path.insert(0, project_root)
 
 # 現在のディレクトリをプロジェクトルートに設定
 try:
@@ -31,98 +33,91 @@ except Exception as e:
 # 一時ファイル用のディレクトリも/tmpに設定
 tempfile.tempdir = '/tmp'
 
-# Flaskアプリをインポート
-app = None
+# Flaskアプリ（最初のリクエスト時に読み込んでキャッシュする）
+_app = None
 import_error = None
 
-try:
-    from web_html_editor import app
-    
-    # アップロードフォルダを設定（念のため再設定）
-    app.config['UPLOAD_FOLDER'] = str(UPLOAD_DIR)
-    
-    # アップロードディレクトリを再作成（念のため）
-    try:
-        Path(app.config['UPLOAD_FOLDER']).mkdir(exist_ok=True, parents=True)
-    except Exception:
-        pass
-    
-except ImportError as e:
-    # インポートエラーの詳細を取得
-    import_error = e
+
+def _error_payload(exc):
+    """初期化エラーの内容をレスポンス用の辞書にまとめる"""
     error_trace = traceback.format_exc()
-    print(f"ImportError: {e}", file=sys.stderr)
-    print(f"Python path: {sys.path}", file=sys.stderr)
-    print(f"Project root: {project_root}", file=sys.stderr)
-    print(f"Current dir: {os.getcwd()}", file=sys.stderr)
+    if isinstance(exc, ImportError):
+        print(f"ImportError: {exc}", file=sys.stderr)
+        print(f"Python path: {sys.path}", file=sys.stderr)
+        print(f"Project root: {project_root}", file=sys.stderr)
+        print(f"Current dir: {os.getcwd()}", file=sys.stderr)
+    else:
+        print(f"Error: {exc}", file=sys.stderr)
     print(error_trace, file=sys.stderr)
-    
-    # エラー用の最小限のFlaskアプリを作成
-    from flask import Flask, jsonify
-    error_app = Flask(__name__)
-    
-    @error_app.route('/', defaults={'path': ''})
-    @error_app.route('/<path:path>')
-    def error_handler(path):
-        return jsonify({
-            'error': 'Application initialization failed',
-            'type': 'ImportError',
-            'message': str(e),
-            'python_path': sys.path,
+
+    payload = {
+        'error': 'Application initialization failed',
+        'type': type(exc).__name__,
+        'message': str(exc),
+        'traceback': error_trace.split('\n')[-15:]  # 最後の15行
+    }
+    if isinstance(exc, ImportError):
+        payload.update({
+            'python_path': list(sys.path),
             'project_root': project_root,
             'current_dir': os.getcwd(),
-            'traceback': error_trace.split('\n')[-15:]  # 最後の15行
-        }), 500
-    
-    app = error_app
-    
-except Exception as e:
-    # その他のエラー
-    import_error = e
-    error_trace = traceback.format_exc()
-    print(f"Error: {e}", file=sys.stderr)
-    print(error_trace, file=sys.stderr)
-    
-    # エラー用の最小限のFlaskアプリを作成
-    from flask import Flask, jsonify
-    error_app = Flask(__name__)
-    
-    @error_app.route('/', defaults={'path': ''})
-    @error_app.route('/<path:path>')
-    def error_handler(path):
-        return jsonify({
-            'error': 'Application initialization failed',
-            'type': type(e).__name__,
-            'message': str(e),
-            'traceback': error_trace.split('\n')[-15:]  # 最後の15行
-        }), 500
-    
-    app = error_app
-
-# アプリが正常に読み込まれたか確認
-if app is None:
-    from flask import Flask, jsonify
-    app = Flask(__name__)
-    
-    @app.route('/', defaults={'path': ''})
-    @app.route('/<path:path>')
+        })
+    return payload
+
+
+def _make_error_app(payload):
+    """payloadを500で返すだけの最小限のFlaskアプリを作成（Flaskはエラー時のみ読み込む）"""
+    from flask import Flask, Response
+
+    # レスポンス内容は初期化後に変わらないため、JSONを一度だけ生成しておく
+    body_json = json.dumps(payload)
+
     def error_handler(path):
-        return jsonify({
-            'error': 'Application is None',
-            'message': 'Failed to initialize application'
-        }), 500
-
-# Vercel用にhandlerをエクスポート（必須）
-# VercelのPythonランタイムがhandlerをクラスとして扱おうとしている問題を回避するため、
-# handlerを関数として定義し、その中でFlaskアプリを呼び出す
-# VercelのPythonランタイムは、handlerが関数またはWSGIアプリケーションであることを期待している
-# しかし、内部実装がクラスを期待している可能性があるため、関数として定義する
-def handler(environ, start_response):
-    """
-    Vercel用のWSGIハンドラー
-    environ: WSGI環境変数
-    start_response: WSGI start_response関数
-    """
-    # FlaskアプリはWSGIアプリケーションなので、直接呼び出す
-    return app(environ, start_response)
+        return Response(body_json, status=500, mimetype='application/json')
+
+    error_app = Flask(__name__)
+    error_app.add_url_rule('/', 'error_handler', error_handler, defaults={'path': ''})
+    error_app.add_url_rule('/<path:path>', 'error_handler', error_handler)
+    return error_app
+
+
+def _get_app():
+    """Flaskアプリを遅延読み込みして返す（2回目以降はキャッシュを返す）"""
+    global _app, import_error
+    if _app is not None:
+        return _app
+
+    try:
+        from web_html_editor import app as loaded_app
+
+        # アップロードフォルダを設定（ディレクトリはモジュール読み込み時に作成済み）
+        loaded_app.config['UPLOAD_FOLDER'] = str(UPLOAD_DIR)
+
+        _app = loaded_app
+    except Exception as e:
+        # インポートエラー・その他のエラーはエラー内容を返すアプリで代替する
+        import_error = e
+        _app = _make_error_app(_error_payload(e))
+
+    # 以降は通常のモジュール属性として参照できるようにする（__getattr__を経由しない）
+    globals()['app'] = _app
+    return _app
+
+
+# Vercel用にFlaskアプリ(WSGIアプリケーション)を `app` としてエクスポートする
+# ラッパー関数(handler)を挟まず、ランタイムからFlaskアプリを直接呼び出させる
+def __getattr__(name):
+    """`app` 属性へのアクセス時にFlaskアプリを遅延読み込みする"""
+    if name == 'app':
+        return _get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """dir()ベースでエクスポートを検出するランタイム向けに `app` を含める"""
+    return sorted(set(globals()) | {'app'})
+
 
+# CIのスモークテスト等で起動時に読み込みたい場合は HTML_EDITOR_EAGER_IMPORT=1 を指定する
+if os.environ.get('HTML_EDITOR_EAGER_IMPORT') == '1':
+    _get_app()
@@ -8,14 +8,23 @@ HTMLエディタ パッケージ作成スクリプト
 # このファイルは、`C:\\devlop\\html` を配布用フォルダ（`html_editor_package`）にまとめるためのツールです。
 # 依存ファイルをコピーし、不要物を除外して「他PCでも動く」一式を作成します。
 
+import fnmatch
 import os
+import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# sendfile等が使えずPython側でコピーする場合のバッファサイズを拡大（デフォルトは64KiB）
+shutil.COPY_BUFSIZE = 4 * 1024 * 1024
+
 # パッケージ名
 PACKAGE_NAME = "html_editor_package"
 
+# ファイルコピーの並列数
+COPY_WORKERS = 8
+
 # 含めるファイル
 INCLUDE_FILES = [
     "web_html_editor.py",
@@ -57,6 +66,36 @@ EXCLUDE_PATTERNS = [
     "create_package.py",
 ]
 
+# メンバーシップ判定用の集合（リストの線形探索を避ける）
+INCLUDE_FILES_SET = frozenset(INCLUDE_FILES)
+OPTIONAL_FILES_SET = frozenset(OPTIONAL_FILES)
+
+# EXCLUDE_PATTERNSを1つの正規表現にまとめたもの（ファイル名ごとのパターン走査を避ける）
+_EXCLUDE_RE = re.compile('|'.join(
+    f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in EXCLUDE_PATTERNS
+))
+
+
+def _package_ignore(src_root):
+    """
+    copytree用のignore関数を作成する
+
+    EXCLUDE_PATTERNSに一致する名前に加え、ルート直下ではINCLUDE_FILES/OPTIONAL_FILES以外を除外する。
+    """
+    wanted = INCLUDE_FILES_SET | OPTIONAL_FILES_SET
+    root = os.fspath(src_root)
+
+    def _ignore(directory, names):
+        ignored = set()
+        for name in names:
+            if _EXCLUDE_RE.match(os.path.normcase(name)):
+                ignored.add(name)
+        if os.fspath(directory) == root:
+            ignored.update(name for name in names if name not in wanted)
+        return ignored
+
+    return _ignore
+
 
 def create_package():
     """パッケージを作成する"""
@@ -81,24 +120,31 @@ def create_package():
     print()
     print("必要なファイルをコピー中...")
     
-    # 必須ファイルをコピー
+    # 対象ファイルをまとめてコピー（走査はcopytree、コピー自体はスレッドで並列実行）
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures = []
+
+        def _submit_copy(src, dst):
+            futures.append(executor.submit(shutil.copy2, src, dst))
+
+        shutil.copytree(current_dir, package_dir, ignore=_package_ignore(current_dir),
+                        copy_function=_submit_copy, dirs_exist_ok=True)
+        for future in as_completed(futures):
+            future.result()
+    packaged = set(os.listdir(package_dir))
+    
+    # 必須ファイルの結果
     copied_files = []
     for filename in INCLUDE_FILES:
-        src = current_dir / filename
-        if src.exists():
-            dst = package_dir / filename
-            shutil.copy2(src, dst)
+        if filename in packaged:
             copied_files.append(filename)
             print(f"  [OK] {filename}")
         else:
             print(f"  [NG] {filename} (見つかりません)")
     
-    # オプションファイルをコピー
+    # オプションファイルの結果
     for filename in OPTIONAL_FILES:
-        src = current_dir / filename
-        if src.exists():
-            dst = package_dir / filename
-            shutil.copy2(src, dst)
+        if filename in packaged:
             copied_files.append(filename)
             print(f"  [OK] {filename} (オプション)")
     
@@ -12,15 +12,19 @@ import argparse
 import sys
 import io
 from pathlib import Path
-from bs4 import BeautifulSoup
-from html_editor import HTMLEditor
+from typing import TYPE_CHECKING
+
+# bs4/lxmlの読み込みは重いため、実際に使う箇所で遅延インポートする（--help等を高速化）
+if TYPE_CHECKING:
+    from html_editor import HTMLEditor
 
 # Windowsでの日本語表示対応
 if sys.platform == 'win32':
     try:
-        # コードページをUTF-8に変更
-        import os
-        os.system('chcp 65001 >nul 2>&1')
+        # コードページをUTF-8に変更（chcpのサブプロセスを起動せずAPIを直接呼ぶ）
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+        ctypes.windll.kernel32.SetConsoleCP(65001)
         # 標準出力のエンコーディングをUTF-8に設定
         if hasattr(sys.stdout, 'buffer'):
             sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -31,29 +35,44 @@ if sys.platform == 'win32':
         pass
 
 
+# メニュー表示用の文字列（毎回printを繰り返さず、1回の書き込みで表示する）
+_MENU = "\n".join([
+    "",
+    "=" * 60,
+    "HTML編集メニュー",
+    "=" * 60,
+    "1. 構造情報を表示",
+    "2. IDで要素を検索・編集",
+    "3. クラスで要素を検索・編集",
+    "4. タグで要素を検索・編集",
+    "5. タイトルを編集",
+    "6. メタタグを編集",
+    "7. リンク一覧を表示",
+    "8. 画像一覧を表示",
+    "9. 要素を追加",
+    "10. 要素を削除",
+    "11. 要素を置き換え",
+    "12. 変更を保存",
+    "13. 別名で保存",
+    "0. 終了",
+    "=" * 60,
+]) + "\n"
+
+
 def print_menu():
     """メニューを表示"""
-    print("\n" + "=" * 60)
-    print("HTML編集メニュー")
-    print("=" * 60)
-    print("1. 構造情報を表示")
-    print("2. IDで要素を検索・編集")
-    print("3. クラスで要素を検索・編集")
-    print("4. タグで要素を検索・編集")
-    print("5. タイトルを編集")
-    print("6. メタタグを編集")
-    print("7. リンク一覧を表示")
-    print("8. 画像一覧を表示")
-    print("9. 要素を追加")
-    print("10. 要素を削除")
-    print("11. 要素を置き換え")
-    print("12. 変更を保存")
-    print("13. 別名で保存")
-    print("0. 終了")
-    print("=" * 60)
-
-
-def edit_element_by_id(editor: HTMLEditor):
+    sys.stdout.write(_MENU)
+
+
+def _parse_fragment(new_html: str) -> list:
+    """入力されたHTML断片を解析し、要素に挿入するノードのリストを返す"""
+    from bs4 import BeautifulSoup
+    # lxmlは断片を<html><body>で包み、先頭の<script>/<style>/<meta>を<head>へ移してしまうため、
+    # 入力どおりの順序でノードを残すhtml.parserで解析する
+    return list(BeautifulSoup(new_html, 'html.parser').contents)
+
+
+def edit_element_by_id(editor: "HTMLEditor"):
     """IDで要素を検索して編集"""
     element_id = input("検索するIDを入力してください: ").strip()
     if not element_id:
@@ -86,12 +105,16 @@ def edit_element_by_id(editor: HTMLEditor):
         print(f"属性 '{attr_name}' を '{attr_value}' に更新しました。")
     elif choice == "3":
         new_html = input("新しいHTMLコンテンツを入力してください: ")
-        element.string = ""
-        element.append(BeautifulSoup(new_html, 'html.parser'))
+        nodes = _parse_fragment(new_html)
+        element.clear()
+        for node in nodes:
+            element.append(node)
+        # 要素を直接変更したため、エディタの検索の索引・集計結果を破棄する
+        editor.invalidate()
         print("HTMLコンテンツを更新しました。")
 
 
-def edit_element_by_class(editor: HTMLEditor):
+def edit_element_by_class(editor: "HTMLEditor"):
     """クラスで要素を検索して編集"""
     class_name = input("検索するクラス名を入力してください: ").strip()
     if not class_name:
@@ -123,7 +146,7 @@ def edit_element_by_class(editor: HTMLEditor):
         print("無効な入力です。")
 
 
-def edit_element_by_tag(editor: HTMLEditor):
+def edit_element_by_tag(editor: "HTMLEditor"):
     """タグで要素を検索して編集"""
     tag_name = input("検索するタグ名を入力してください (例: div, p, a): ").strip()
     if not tag_name:
@@ -156,7 +179,7 @@ def edit_element_by_tag(editor: HTMLEditor):
         print("無効な入力です。")
 
 
-def edit_title(editor: HTMLEditor):
+def edit_title(editor: "HTMLEditor"):
     """タイトルを編集"""
     current_title = editor.get_title()
     print(f"現在のタイトル: {current_title}")
@@ -168,7 +191,7 @@ def edit_title(editor: HTMLEditor):
         print("タイトルが入力されていません。")
 
 
-def edit_meta(editor: HTMLEditor):
+def edit_meta(editor: "HTMLEditor"):
     """メタタグを編集"""
     meta_name = input("メタタグのnameまたはpropertyを入力してください: ").strip()
     if not meta_name:
@@ -185,41 +208,43 @@ def edit_meta(editor: HTMLEditor):
         print("値が入力されていません。")
 
 
-def show_links(editor: HTMLEditor):
+def show_links(editor: "HTMLEditor"):
     """リンク一覧を表示"""
     links = editor.get_all_links()
-    print(f"\nリンク数: {len(links)}")
-    print("-" * 60)
+    # 行ごとにprintせず、まとめて1回で出力する
+    lines = [f"\nリンク数: {len(links)}", "-" * 60]
     for i, link in enumerate(links[:20], 1):  # 最初の20個のみ表示
-        print(f"{i}. {link['text']}")
-        print(f"   URL: {link['href']}")
+        lines.append(f"{i}. {link['text']}")
+        lines.append(f"   URL: {link['href']}")
         if link['id']:
-            print(f"   ID: {link['id']}")
+            lines.append(f"   ID: {link['id']}")
         if link['class']:
-            print(f"   クラス: {link['class']}")
-        print()
+            lines.append(f"   クラス: {link['class']}")
+        lines.append("")
     
     if len(links) > 20:
-        print(f"... 他 {len(links) - 20}個のリンク")
+        lines.append(f"... 他 {len(links) - 20}個のリンク")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def show_images(editor: HTMLEditor):
+def show_images(editor: "HTMLEditor"):
     """画像一覧を表示"""
     images = editor.get_all_images()
-    print(f"\n画像数: {len(images)}")
-    print("-" * 60)
+    # 行ごとにprintせず、まとめて1回で出力する
+    lines = [f"\n画像数: {len(images)}", "-" * 60]
     for i, img in enumerate(images, 1):
-        print(f"{i}. {img['src']}")
+        lines.append(f"{i}. {img['src']}")
         if img['alt']:
-            print(f"   Alt: {img['alt']}")
+            lines.append(f"   Alt: {img['alt']}")
         if img['id']:
-            print(f"   ID: {img['id']}")
+            lines.append(f"   ID: {img['id']}")
         if img['class']:
-            print(f"   クラス: {img['class']}")
-        print()
+            lines.append(f"   クラス: {img['class']}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def add_element(editor: HTMLEditor):
+def add_element(editor: "HTMLEditor"):
     """要素を追加"""
     tag = input("追加するタグ名を入力してください (例: div, p, span): ").strip()
     if not tag:
@@ -266,7 +291,7 @@ def add_element(editor: HTMLEditor):
     print(f"要素 '<{tag}>' を追加しました。")
 
 
-def remove_element(editor: HTMLEditor):
+def remove_element(editor: "HTMLEditor"):
     """要素を削除"""
     element_id = input("削除する要素のIDを入力してください: ").strip()
     if not element_id:
@@ -287,7 +312,7 @@ def remove_element(editor: HTMLEditor):
         print("削除をキャンセルしました。")
 
 
-def replace_element(editor: HTMLEditor):
+def replace_element(editor: "HTMLEditor"):
     """要素を置き換え"""
     element_id = input("置き換える要素のIDを入力してください: ").strip()
     if not element_id:
@@ -309,6 +334,53 @@ def replace_element(editor: HTMLEditor):
     print("要素を置き換えました。")
 
 
+def show_structure(editor: "HTMLEditor"):
+    """構造情報を表示"""
+    print("\n構造情報を取得中...", flush=True)
+    try:
+        # 構造情報を表示
+        editor.print_structure()
+        print("\n構造情報の表示が完了しました。", flush=True)
+    except Exception as e:
+        print(f"\nエラー: 構造情報の表示中に問題が発生しました: {e}", flush=True)
+        import traceback
+        traceback.print_exc()
+    # 次のメニュー表示前に少し待機
+    input("\nEnterキーを押してメニューに戻ります...")
+
+
+def save_changes(editor: "HTMLEditor"):
+    """変更を保存"""
+    editor.save()
+
+
+def save_as(editor: "HTMLEditor"):
+    """別名で保存"""
+    output_path = input("保存先のファイルパスを入力してください: ").strip()
+    if output_path:
+        editor.save(output_path)
+    else:
+        print("ファイルパスが入力されていません。")
+
+
+# メニュー番号と処理関数の対応表（"0"の終了はmain()で処理）
+_ACTIONS = {
+    "1": show_structure,
+    "2": edit_element_by_id,
+    "3": edit_element_by_class,
+    "4": edit_element_by_tag,
+    "5": edit_title,
+    "6": edit_meta,
+    "7": show_links,
+    "8": show_images,
+    "9": add_element,
+    "10": remove_element,
+    "11": replace_element,
+    "12": save_changes,
+    "13": save_as,
+}
+
+
 def main():
     """メイン関数"""
     parser = argparse.ArgumentParser(
@@ -339,6 +411,8 @@ def main():
         print(f"エラー: ファイル '{html_path}' が見つかりません。")
         sys.exit(1)
     
+    from html_editor import HTMLEditor
+    
     try:
         print(f"HTMLファイルを読み込み中: {html_path}")
         editor = HTMLEditor(str(html_path), encoding=args.encoding)
@@ -356,52 +430,17 @@ def main():
                 print("選択が入力されていません。再度入力してください。")
                 continue
             
+            if choice == "0":
+                print("終了します。")
+                break
+            
+            action = _ACTIONS.get(choice)
+            if action is None:
+                print("無効な選択です。")
+                continue
+            
             try:
-                if choice == "0":
-                    print("終了します。")
-                    break
-                elif choice == "1":
-                    print("\n構造情報を取得中...", flush=True)
-                    try:
-                        # 構造情報を表示
-                        editor.print_structure()
-                        print("\n構造情報の表示が完了しました。", flush=True)
-                    except Exception as e:
-                        print(f"\nエラー: 構造情報の表示中に問題が発生しました: {e}", flush=True)
-                        import traceback
-                        traceback.print_exc()
-                    # 次のメニュー表示前に少し待機
-                    input("\nEnterキーを押してメニューに戻ります...")
-                elif choice == "2":
-                    edit_element_by_id(editor)
-                elif choice == "3":
-                    edit_element_by_class(editor)
-                elif choice == "4":
-                    edit_element_by_tag(editor)
-                elif choice == "5":
-                    edit_title(editor)
-                elif choice == "6":
-                    edit_meta(editor)
-                elif choice == "7":
-                    show_links(editor)
-                elif choice == "8":
-                    show_images(editor)
-                elif choice == "9":
-                    add_element(editor)
-                elif choice == "10":
-                    remove_element(editor)
-                elif choice == "11":
-                    replace_element(editor)
-                elif choice == "12":
-                    editor.save()
-                elif choice == "13":
-                    output_path = input("保存先のファイルパスを入力してください: ").strip()
-                    if output_path:
-                        editor.save(output_path)
-                    else:
-                        print("ファイルパスが入力されていません。")
-                else:
-                    print("無効な選択です。")
+                action(editor)
             except Exception as e:
                 print(f"エラーが発生しました: {e}")
                 import traceback
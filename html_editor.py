@@ -8,39 +8,431 @@ BeautifulSoupを使用してHTMLファイルを解析・編集するプログラ
 # このファイルは、HTMLを解析/検索/検証するための中核ロジック（`HTMLEditor`）を提供します。
 # Web版（`web_html_editor.py`）やCLIツールから読み込まれ、HTML構造解析や検索、簡易バリデーションを行います。
 
-from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+from bs4 import BeautifulSoup, FeatureNotFound, MarkupResemblesLocatorWarning, SoupStrainer, Tag
+from bs4.builder import builder_registry
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
 from pathlib import Path
 import re
+import sys
 from typing import Optional, List, Dict, Any, Tuple
+import functools
 import json
+import os
 import warnings
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 構造情報の集計対象のタグ
+_STRUCTURE_TAGS = ('a', 'img', 'script', 'link', 'form', 'meta')
+
+# リンクのテキストの取得（BeautifulSoupのget_textと同じく、script/style/template内の文字列は含めない）
+_LINK_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+) if etree is not None else None
+
+# head_onlyで読み込むタグ（本文のタグはBeautifulSoupの要素を作らずに読み飛ばす）
+_HEAD_STRAINER = SoupStrainer(['head', 'title', 'meta'])
+
+# 閉じタグを持たない自己完結型タグ
+_VOID_TAGS = frozenset({
+    'br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr'
+})
+
+# 検証で使う正規表現（呼び出しごとにコンパイルしないようモジュールで保持）
+# タグの整合性チェックは内容全体に対して一度に走査するため、行をまたがないよう改行を除外している
+_TAG_RE = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>\n]*>')
+# 属性チェック用のimg・aタグ（複数行にまたがるタグも1つのタグとして一致させ、属性の有無は一致したタグの中で判定する）
+_IMG_TAG_RE = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+_A_TAG_RE = re.compile(r'<a\b[^>]*>', re.IGNORECASE)
+# html・head・bodyは小文字化した内容に対して使う（大文字小文字を無視した照合を行わない）
+_HTML_RE = re.compile(r'<html[^>]*>')
+_HEAD_RE = re.compile(r'<head[^>]*>')
+_BODY_RE = re.compile(r'<body[^>]*>')
+_WARN_LINE_RE = re.compile(r'line\s+(\d+)', re.IGNORECASE)
+
+# 読み込み時に記録したパース警告を通知し直すときの重複抑制用（同じ警告は通常どおり1回だけ表示する）
+_WARNING_REGISTRY = {}
+
+# 1行内のタグを開始の「<」（直前がバックスラッシュでないもの）から走査する
+# 引用符の外の「>」で閉じた場合はclose、引用符が閉じないまま行末に達した場合はquote、
+# 「>」がないまま行末に達した場合はどちらも空になる（バックスラッシュ直後の引用符は閉じ引用符とみなさない）
+_TAG_SCAN_RE = re.compile(
+    r'''(?<!\\)<'''
+    r'''(?:[^>"']|"(?:[^"]|(?<=\\)")*(?<!\\)"|'(?:[^']|(?<=\\)')*(?<!\\)')*'''
+    r'''(?:(?P<close>>)|(?P<quote>["']).*|$)'''
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_pattern(text: str, exact: bool):
+    """find_by_text用の正規表現をコンパイル（同じ検索語はキャッシュを再利用）"""
+    if exact:
+        return re.compile(f'^{re.escape(text)}$')
+    return re.compile(re.escape(text))
+
+
+def _line_starts(lines: List[str]) -> List[int]:
+    """各行の先頭が内容全体の何文字目かのリスト（位置から行・列を求めるために使う）"""
+    return list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+
+def _line_col(line_starts: List[int], pos: int) -> Tuple[int, int]:
+    """内容全体での位置を (行番号(1始まり), 列) に変換する"""
+    line_index = bisect_right(line_starts, pos) - 1
+    return line_index + 1, pos - line_starts[line_index]
+
+
+def _attr_matches(element: Tag, attr_name: str, attr_value: str) -> bool:
+    """
+    find_all(attrs={attr_name: attr_value})と同じ規則で属性値が一致するか判定
+    
+    classのような複数値の属性は、いずれかの値または属性全体（空白区切り）と一致すればよい。
+    """
+    value = element.get(attr_name)
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value == attr_value
+    return attr_value in value or ' '.join(value) == attr_value
+
+
+def _lxml_values(element, attr_name: str) -> List[str]:
+    """lxmlの要素の空白区切りの属性値（class・rel）をリストで取得"""
+    return element.get(attr_name, '').split()
+
+
+def _soup_values(element: Tag, attr_name: str) -> List[str]:
+    """BeautifulSoupの要素の複数値の属性（class・rel）をリストで取得"""
+    return element.get(attr_name) or []
+
+
+def _lxml_link_text(element) -> str:
+    """lxmlの要素のテキストをBeautifulSoupのget_text(strip=True)と同じ規則で取得"""
+    return ''.join(text.strip() for text in _LINK_TEXT_XPATH(element))
+
+
+def _soup_link_text(element: Tag) -> str:
+    """BeautifulSoupの要素のテキストを取得"""
+    return element.get_text(strip=True)
+
+
+def _collect_element(collected: tuple, element, tag: str, values, link_text):
+    """
+    集計対象の要素1つを、リンク・画像・構造情報の集計結果に加える
+    
+    lxmlの要素とBeautifulSoupの要素の両方に使うため、複数値の属性とテキストの取得方法は関数で受け取る。
+    
+    Args:
+        collected: (リンクのリスト, 画像のリスト, タグごとの件数, メタタグ) のタプル
+        element: 要素
+        tag: タグ名
+        values: 複数値の属性をリストで取得する関数
+        link_text: リンクのテキストを取得する関数
+    """
+    links, images, counts, meta_tags = collected
+    if tag == 'a':
+        links.append({
+            'text': link_text(element),
+            'href': element.get('href', ''),
+            'id': element.get('id', ''),
+            'class': ' '.join(values(element, 'class'))
+        })
+    elif tag == 'img':
+        images.append({
+            'src': element.get('src', ''),
+            'alt': element.get('alt', ''),
+            'id': element.get('id', ''),
+            'class': ' '.join(values(element, 'class'))
+        })
+    elif tag == 'link':
+        if 'stylesheet' in values(element, 'rel'):
+            counts['stylesheet'] += 1
+        return
+    elif tag == 'meta':
+        name = element.get('name') or element.get('property')
+        if name:
+            meta_tags[name] = element.get('content', '')
+        return
+    counts[tag] += 1
+
+
+def _check_strict_parsing(content: str) -> List[Dict[str, Any]]:
+    """lxmlパーサーが利用可能な場合は、より厳密なチェックを実行"""
+    errors = []
+    
+    try:
+        from lxml import etree
+        from lxml.html import HTMLParser
+        
+        parser = HTMLParser(recover=False, encoding='utf-8')
+        try:
+            etree.fromstring(content.encode('utf-8'), parser=parser)
+        except etree.XMLSyntaxError as e:
+            # lxmlのエラーメッセージから行番号を取得
+            line_num = getattr(e, 'lineno', 1)
+            column = getattr(e, 'offset', 0)
+            errors.append({
+                'type': 'error',
+                'message': f'XML構文エラー: {str(e)}',
+                'line': line_num,
+                'column': column
+            })
+    except ImportError:
+        # lxmlがインストールされていない場合はスキップ
+        pass
+    except Exception as e:
+        # lxmlでのチェック中にエラーが発生した場合は無視（html.parserの結果を優先）
+        pass
+    
+    return errors
+
 
 class HTMLEditor:
     """HTMLファイルを構文解析・編集するクラス"""
     
-    def __init__(self, html_file_path: str, encoding: str = 'utf-8'):
+    def __init__(self, html_file_path: str, encoding: str = 'utf-8', parser: str = 'lxml',
+                 parse_only: Optional[SoupStrainer] = None):
         """
         初期化
         
         Args:
             html_file_path: HTMLファイルのパス
             encoding: ファイルのエンコーディング（デフォルト: utf-8）
+            parser: BeautifulSoupのパーサー（デフォルト: lxml、利用できない場合はhtml.parser）
+            parse_only: 指定した場合、SoupStrainerに一致する部分だけをsoupに読み込む（検証はファイル全体に対して行う）
         """
-        self.html_file_path = Path(html_file_path)
-        self.encoding = encoding
-        self.soup = None
+        self._init_state(Path(html_file_path), encoding, parser, parse_only)
         self._load_html()
     
+    @classmethod
+    def from_string(cls, html: str, encoding: str = 'utf-8', parser: str = 'lxml',
+                    parse_only: Optional[SoupStrainer] = None) -> 'HTMLEditor':
+        """
+        HTML文字列からエディタを作成（ファイルの読み込みは行わない）
+        
+        Args:
+            html: HTMLの文字列
+            encoding: 保存時のエンコーディング（デフォルト: utf-8）
+            parser: BeautifulSoupのパーサー（デフォルト: lxml、利用できない場合はhtml.parser）
+            parse_only: 指定した場合、SoupStrainerに一致する部分だけをsoupに読み込む
+        
+        Returns:
+            HTMLEditorオブジェクト（html_file_pathはNoneのため、saveでは出力先の指定が必要）
+        """
+        editor = cls.__new__(cls)
+        editor._init_state(None, encoding, parser, parse_only)
+        editor._set_source(editor._store_content(html, None))
+        return editor
+    
+    @classmethod
+    def head_only(cls, html_file_path: str, encoding: str = 'utf-8', parser: str = 'lxml') -> 'HTMLEditor':
+        """
+        <head>内のタイトル・メタタグだけを読み込んだエディタを作成
+        
+        get_title・get_metaなどで本文が不要な場合に使う。本文を含まないため、元のファイルへの上書き保存には使わないこと。
+        """
+        return cls(html_file_path, encoding=encoding, parser=parser, parse_only=_HEAD_STRAINER)
+    
+    def _init_state(self, html_file_path: Optional[Path], encoding: str, parser: str,
+                    parse_only: Optional[SoupStrainer]):
+        """属性とキャッシュを初期化"""
+        self.html_file_path = html_file_path
+        self.encoding = encoding
+        # 利用できないパーサーは初期化時にhtml.parserへ切り替える（soupの解析は初回アクセス時まで遅らせる）
+        self.parser = parser if builder_registry.lookup(parser) is not None else 'html.parser'
+        self.parse_only = parse_only
+        # BeautifulSoupオブジェクトと、その解析待ちのHTML（soupプロパティの初回アクセス時に解析する）
+        self._soup = None
+        self._source = None
+        # 読み込んだHTML（DOMを変更するまで保持し、lxmlツリーの構築に使う）
+        self._content = None
+        # 読み取り専用の集計用lxmlツリー（遅延構築）
+        self._tree = None
+        # リンク・画像・構造情報の集計結果（1回の走査でまとめて集計し、DOM変更時に破棄する）
+        self._collected = None
+        # タグ名・IDから要素を引く索引（初回の検索時に構築し、DOM変更時に破棄する）
+        self._elements: Optional[list] = None
+        self._tag_index: Optional[Dict[str, list]] = None
+        self._id_index: Optional[Dict[str, Any]] = None
+        # 検証用に保持するファイルの内容・行・更新時刻と、読み込み時のパース警告
+        self._raw_content = None
+        self._lines = None
+        self._file_stat = None
+        self._parse_warnings = None
+        # 前回のvalidate_htmlの結果（ファイルが更新されるまで再利用する）
+        self._validation_errors = None
+    
+    def _parse(self, content: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        self.parserでHTMLを解析する
+        
+        パーサーが利用できない場合はhtml.parserに切り替え、以降もその選択を使う。
+        """
+        try:
+            return BeautifulSoup(content, self.parser, parse_only=parse_only)
+        except FeatureNotFound:
+            self.parser = 'html.parser'
+            return BeautifulSoup(content, self.parser, parse_only=parse_only)
+    
+    @property
+    def soup(self) -> BeautifulSoup:
+        """
+        BeautifulSoupオブジェクト
+        
+        parserがlxmlの場合、構造情報の取得など読み取り専用の集計はlxmlツリーで行うため、soupは初回アクセス時に解析する。
+        soupを直接変更した場合は、変更後にinvalidate()を呼び出すこと。
+        """
+        if self._soup is None and self._source is not None:
+            self._parse_source()
+        return self._soup
+    
+    @soup.setter
+    def soup(self, value: BeautifulSoup):
+        self.invalidate()
+        self._soup = value
+        self._source = None
+    
+    def _parse_source(self):
+        """読み込み済みのHTMLを解析してsoupを作成"""
+        content = self._source
+        
+        # パース時の警告はvalidate_htmlで再利用するため記録し、呼び出し元には従来どおり通知する
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self._soup = self._parse(content, self.parse_only)
+        for warning in caught:
+            warnings.warn_explicit(warning.message, warning.category, warning.filename, warning.lineno,
+                                   registry=_WARNING_REGISTRY)
+        # 一部だけを読み込んだ場合や、その後ファイルを読み直した場合は、警告がファイルの内容と一致しないため使わない
+        if self.parse_only is None and content is self._raw_content:
+            self._parse_warnings = caught
+        self._source = None
+    
     def _load_html(self):
-        """HTMLファイルを読み込んでBeautifulSoupオブジェクトを作成"""
+        """HTMLファイルを読み込む（BeautifulSoupオブジェクトはsoupの初回アクセス時に作成）"""
         if not self.html_file_path.exists():
             raise FileNotFoundError(f"ファイルが見つかりません: {self.html_file_path}")
         
-        with open(self.html_file_path, 'r', encoding=self.encoding) as f:
-            content = f.read()
+        self._set_source(self._read_file())
+    
+    def _set_source(self, content: str):
+        """解析前のHTMLを設定し、以前の内容から作った派生データを破棄する"""
+        self._soup = None
+        self._source = content
+        # 一部だけを読み込む場合、lxmlツリーはファイル全体ではなくsoupから作る
+        self._content = content if self.parse_only is None else None
+        self._tree = None
+        self._collected = None
+        self._elements = None
+        self._tag_index = None
+        self._id_index = None
+    
+    def _read_file(self) -> str:
+        """HTMLファイルを読み込み、検証用の内容・行・更新時刻をキャッシュする"""
+        # バイト列のまま読み込んで一度にデコードする（テキストモードの逐次デコードを避ける）
+        with open(self.html_file_path, 'rb') as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+        return self._store_content(data.decode(self.encoding), (stat.st_mtime_ns, stat.st_size))
+    
+    def _store_content(self, content: str, file_stat: Optional[Tuple[int, int]]) -> str:
+        """検証用の内容・行・更新時刻をキャッシュする（file_statはファイルの更新時刻とサイズ）"""
+        # テキストモードで読んだ場合と同じく改行を\nに統一する
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        self._raw_content = content
+        self._lines = content.split('\n')
+        self._file_stat = file_stat
+        # 内容が変わった可能性があるため、パース警告・検証結果は取り直す
+        self._parse_warnings = None
+        self._validation_errors = None
+        return content
+    
+    def _file_changed(self) -> bool:
+        """前回読み込んだ後にファイルが更新されたかどうか（更新時刻とサイズで判定）"""
+        # 文字列から作成した場合は読み直すファイルがない
+        if self.html_file_path is None:
+            return False
+        try:
+            stat = self.html_file_path.stat()
+        except OSError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != self._file_stat
+    
+    def invalidate(self):
+        """
+        DOMを変更したときに、元のHTMLから作った派生データ（検索の索引・集計結果）を破棄する
+        
+        エディタの編集メソッドは自動で呼び出す。soupや検索で取得した要素を直接変更した場合は、
+        以降の検索・集計が変更前の結果を返さないよう、変更後にこのメソッドを呼び出すこと。
+        """
+        self._content = None
+        self._tree = None
+        self._collected = None
+        self._elements = None
+        self._tag_index = None
+        self._id_index = None
+    
+    def _build_index(self):
+        """soupを一度だけ走査して、全要素（文書順）・タグ名・IDの索引を構築する"""
+        elements = []
+        tag_index = {}
+        id_index = {}
+        for element in self.soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            elements.append(element)
+            tag_index.setdefault(element.name, []).append(element)
+            element_id = element.get('id')
+            # soup.find(id=...)と同じく、同じIDが複数あれば最初の要素を返す
+            if element_id is not None and element_id not in id_index:
+                id_index[element_id] = element
+        self._elements = elements
+        self._tag_index = tag_index
+        self._id_index = id_index
+    
+    def _all_elements(self) -> list:
+        """索引から全要素のリストを取得（文字列ノードを含まない、文書順）"""
+        if self._elements is None:
+            self._build_index()
+        return self._elements
+    
+    def _elements_by_tag(self, tag_name: str) -> list:
+        """索引からタグ名に一致する要素のリストを取得（文書順）"""
+        if self._tag_index is None:
+            self._build_index()
+        return self._tag_index.get(tag_name, [])
+    
+    def _tree_available(self) -> bool:
+        """
+        読み込んだHTMLから集計用のlxmlツリーを作れるかどうか
         
-        self.soup = BeautifulSoup(content, 'html.parser')
+        DOMを変更した後や一部だけを読み込んだ場合は、soupを文字列にして解析し直しても
+        soupと同じツリーになるとは限らないため使わない。
+        """
+        return etree is not None and self._content is not None
+    
+    def _get_tree(self):
+        """
+        読み込んだHTMLから作る読み取り専用の集計用lxmlツリーを取得
+        
+        ツリーは初回に構築する（_tree_availableがTrueの場合だけ呼び出す）。空のHTMLの場合はNone。
+        """
+        if self._tree is None:
+            self._tree = etree.HTML(self._content.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+        return self._tree
     
     def save(self, output_path: Optional[str] = None, pretty_print: bool = True):
         """
@@ -51,24 +443,33 @@ class HTMLEditor:
             pretty_print: 整形して出力するかどうか
         """
         if output_path is None:
+            if self.html_file_path is None:
+                raise ValueError("文字列から作成したエディタの保存には output_path を指定してください")
             output_path = self.html_file_path
         else:
             output_path = Path(output_path)
         
-        # 出力形式を設定
-        if pretty_print:
-            html_str = self.soup.prettify()
-        else:
-            html_str = str(self.soup)
+        # 出力形式を設定（indent_level=0で整形、Noneでそのまま出力）
+        indent_level = 0 if pretty_print else None
         
-        with open(output_path, 'w', encoding=self.encoding) as f:
-            f.write(html_str)
+        # BeautifulSoupで指定エンコーディングのバイト列にして直接書き込む
+        # （文字列を保持したままテキストレイヤーで再エンコードしない。meta charsetも保存時のエンコーディングになる）
+        with open(output_path, 'wb') as f:
+            f.write(self.soup.encode(self.encoding, indent_level=indent_level))
+        
+        # 元のファイルを書き換えた場合は、更新時刻が変わらなくても次の検証で読み直す
+        if self.html_file_path is not None and Path(output_path).resolve() == self.html_file_path.resolve():
+            self._file_stat = None
         
         print(f"保存しました: {output_path}")
     
     def find_by_id(self, element_id: str):
         """IDで要素を検索"""
-        return self.soup.find(id=element_id)
+        if not isinstance(element_id, str):
+            return self.soup.find(id=element_id)
+        if self._id_index is None:
+            self._build_index()
+        return self._id_index.get(element_id)
     
     def find_by_class(self, class_name: str, tag: Optional[str] = None):
         """
@@ -79,16 +480,25 @@ class HTMLEditor:
             tag: タグ名（オプション）
         """
         if tag:
-            return self.soup.find_all(tag, class_=class_name)
-        return self.soup.find_all(class_=class_name)
+            if not isinstance(tag, str) or not isinstance(class_name, str):
+                return self.soup.find_all(tag, class_=class_name)
+            return [element for element in self._elements_by_tag(tag) if _attr_matches(element, 'class', class_name)]
+        if not isinstance(class_name, str):
+            return self.soup.find_all(class_=class_name)
+        return [element for element in self._all_elements() if _attr_matches(element, 'class', class_name)]
     
     def find_by_tag(self, tag_name: str):
         """タグ名で要素を検索"""
-        return self.soup.find_all(tag_name)
+        if not isinstance(tag_name, str):
+            return self.soup.find_all(tag_name)
+        # 索引のリストを呼び出し元に変更されないようコピーして返す
+        return list(self._elements_by_tag(tag_name))
     
     def find_by_attribute(self, attr_name: str, attr_value: str):
         """属性で要素を検索"""
-        return self.soup.find_all(attrs={attr_name: attr_value})
+        if not isinstance(attr_name, str) or not isinstance(attr_value, str):
+            return self.soup.find_all(attrs={attr_name: attr_value})
+        return [element for element in self._all_elements() if _attr_matches(element, attr_name, attr_value)]
     
     def find_by_text(self, text: str, exact: bool = False):
         """
@@ -98,17 +508,29 @@ class HTMLEditor:
             text: 検索するテキスト
             exact: 完全一致かどうか
         """
-        if exact:
-            return self.soup.find_all(string=re.compile(f'^{re.escape(text)}$'))
-        return self.soup.find_all(string=re.compile(re.escape(text)))
+        return self.soup.find_all(string=_text_pattern(text, exact))
     
     def get_title(self) -> Optional[str]:
-        """タイトルを取得"""
+        """
+        タイトルを取得
+        
+        parserがlxmlでsoupが未解析の場合はlxmlツリーから取得し、BeautifulSoupでの解析を省く。
+        titleに子要素がある場合など、テキストの取り出し方で結果が変わりうる場合はsoupから取得する。
+        """
+        # 他のパーサーとはtitleの中身の解釈が異なるため、soupもlxmlで解析する場合だけlxmlツリーを使う
+        if self._soup is None and self.parser == 'lxml' and self._tree_available():
+            tree = self._get_tree()
+            title_tag = tree.find('.//title') if tree is not None else None
+            if title_tag is None:
+                return None
+            if len(title_tag) == 0:
+                return title_tag.text
         title_tag = self.soup.find('title')
         return title_tag.string if title_tag else None
     
     def set_title(self, new_title: str):
         """タイトルを設定"""
+        self.invalidate()
         title_tag = self.soup.find('title')
         if title_tag:
             title_tag.string = new_title
@@ -127,9 +549,16 @@ class HTMLEditor:
             name: メタタグのnameまたはproperty
             attr: 属性名（'name' または 'property'）
         """
-        meta = self.soup.find('meta', attrs={attr: name})
+        meta = self._find_meta(name, attr)
         return meta.get('content') if meta else None
     
+    def _find_meta(self, name: str, attr: str):
+        """attr属性がnameのmetaタグを索引から検索"""
+        for meta in self._elements_by_tag('meta'):
+            if meta.get(attr) == name:
+                return meta
+        return None
+    
     def set_meta(self, name: str, content: str, attr: str = 'name'):
         """
         メタタグを設定
@@ -139,7 +568,8 @@ class HTMLEditor:
             content: コンテンツ
             attr: 属性名（'name' または 'property'）
         """
-        meta = self.soup.find('meta', attrs={attr: name})
+        meta = self._find_meta(name, attr)
+        self.invalidate()
         if meta:
             meta['content'] = content
         else:
@@ -149,29 +579,44 @@ class HTMLEditor:
                 new_meta = self.soup.new_tag('meta', attrs={attr: name, 'content': content})
                 head.append(new_meta)
     
+    def _collect_all(self) -> Tuple[list, list, dict]:
+        """
+        リンク・画像・構造情報を1回の走査でまとめて集計する
+        
+        Returns:
+            (リンクのリスト, 画像のリスト, {'counts': タグごとの件数, 'meta_tags': メタタグ}) のタプル。
+            結果はDOMを変更するまでキャッシュする。
+        """
+        if self._collected is not None:
+            return self._collected
+        
+        links = []
+        images = []
+        counts = Counter()
+        meta_tags = {}
+        collected = (links, images, counts, meta_tags)
+        
+        # lxmlツリーはlxmlで解析した結果のため、soupもlxmlで解析する場合だけ使う（他のパーサーとは解析結果が異なる）
+        if self.parser == 'lxml' and self._tree_available():
+            tree = self._get_tree()
+            for element in (tree.iter(*_STRUCTURE_TAGS) if tree is not None else ()):
+                _collect_element(collected, element, element.tag, _lxml_values, _lxml_link_text)
+        else:
+            for element in self.soup.descendants:
+                if isinstance(element, Tag) and element.name in _STRUCTURE_TAGS:
+                    _collect_element(collected, element, element.name, _soup_values, _soup_link_text)
+        
+        self._collected = (links, images, {'counts': counts, 'meta_tags': meta_tags})
+        return self._collected
+    
     def get_all_links(self) -> List[Dict[str, str]]:
         """すべてのリンク（aタグ）を取得"""
-        links = []
-        for a_tag in self.soup.find_all('a'):
-            links.append({
-                'text': a_tag.get_text(strip=True),
-                'href': a_tag.get('href', ''),
-                'id': a_tag.get('id', ''),
-                'class': ' '.join(a_tag.get('class', []))
-            })
-        return links
+        # キャッシュを呼び出し元に変更されないようコピーして返す
+        return [dict(link) for link in self._collect_all()[0]]
     
     def get_all_images(self) -> List[Dict[str, str]]:
         """すべての画像（imgタグ）を取得"""
-        images = []
-        for img_tag in self.soup.find_all('img'):
-            images.append({
-                'src': img_tag.get('src', ''),
-                'alt': img_tag.get('alt', ''),
-                'id': img_tag.get('id', ''),
-                'class': ' '.join(img_tag.get('class', []))
-            })
-        return images
+        return [dict(image) for image in self._collect_all()[1]]
     
     def update_text(self, element, new_text: str):
         """
@@ -182,6 +627,7 @@ class HTMLEditor:
             new_text: 新しいテキスト
         """
         if element:
+            self.invalidate()
             element.string = new_text
     
     def update_attribute(self, element, attr_name: str, attr_value: str):
@@ -194,6 +640,7 @@ class HTMLEditor:
             attr_value: 属性値
         """
         if element:
+            self.invalidate()
             element[attr_name] = attr_value
     
     def add_element(self, parent, tag: str, text: Optional[str] = None, 
@@ -207,18 +654,18 @@ class HTMLEditor:
             text: テキスト内容
             attrs: 属性の辞書
         """
-        new_element = self.soup.new_tag(tag)
+        self.invalidate()
+        # 属性は1件ずつ設定せず、タグ作成時にまとめて渡す
+        new_element = self.soup.new_tag(tag, attrs=dict(attrs) if attrs else {})
         if text:
             new_element.string = text
-        if attrs:
-            for key, value in attrs.items():
-                new_element[key] = value
         parent.append(new_element)
         return new_element
     
     def remove_element(self, element):
         """要素を削除"""
         if element:
+            self.invalidate()
             element.decompose()
     
     def replace_element(self, old_element, new_tag: str, new_text: Optional[str] = None,
@@ -233,59 +680,56 @@ class HTMLEditor:
             new_attrs: 新しい属性
         """
         if old_element:
-            new_element = self.soup.new_tag(new_tag)
+            self.invalidate()
+            new_element = self.soup.new_tag(new_tag, attrs=dict(new_attrs) if new_attrs else {})
             if new_text:
                 new_element.string = new_text
-            if new_attrs:
-                for key, value in new_attrs.items():
-                    new_element[key] = value
             old_element.replace_with(new_element)
             return new_element
     
     def get_structure_info(self) -> Dict[str, Any]:
         """HTMLの構造情報を取得"""
-        info = {
+        structure = self._collect_all()[2]
+        counts = structure['counts']
+        
+        return {
             'title': self.get_title(),
-            'meta_tags': {},
-            'links_count': len(self.soup.find_all('a')),
-            'images_count': len(self.soup.find_all('img')),
-            'scripts_count': len(self.soup.find_all('script')),
-            'stylesheets_count': len(self.soup.find_all('link', rel='stylesheet')),
-            'forms_count': len(self.soup.find_all('form')),
+            'meta_tags': dict(structure['meta_tags']),
+            'links_count': counts['a'],
+            'images_count': counts['img'],
+            'scripts_count': counts['script'],
+            'stylesheets_count': counts['stylesheet'],
+            'forms_count': counts['form'],
         }
-        
-        # メタタグ情報を取得
-        for meta in self.soup.find_all('meta'):
-            name = meta.get('name') or meta.get('property')
-            if name:
-                info['meta_tags'][name] = meta.get('content', '')
-        
-        return info
     
     def print_structure(self):
         """HTMLの構造を表示"""
         try:
             info = self.get_structure_info()
-            # 出力を即座に表示するためにflush=Trueを使用
-            print("\n" + "=" * 60, flush=True)
-            print("HTML構造情報", flush=True)
-            print("=" * 60, flush=True)
-            print(f"タイトル: {info['title'] or '(タイトルなし)'}", flush=True)
-            print(f"リンク数: {info['links_count']}", flush=True)
-            print(f"画像数: {info['images_count']}", flush=True)
-            print(f"スクリプト数: {info['scripts_count']}", flush=True)
-            print(f"スタイルシート数: {info['stylesheets_count']}", flush=True)
-            print(f"フォーム数: {info['forms_count']}", flush=True)
+            # 表示内容を1つの文字列にまとめ、1回の書き込みとflushで即座に表示する
+            lines = [
+                "\n" + "=" * 60,
+                "HTML構造情報",
+                "=" * 60,
+                f"タイトル: {info['title'] or '(タイトルなし)'}",
+                f"リンク数: {info['links_count']}",
+                f"画像数: {info['images_count']}",
+                f"スクリプト数: {info['scripts_count']}",
+                f"スタイルシート数: {info['stylesheets_count']}",
+                f"フォーム数: {info['forms_count']}",
+            ]
             
             if info['meta_tags']:
-                print("\nメタタグ:", flush=True)
+                lines.append("\nメタタグ:")
                 for name, content in info['meta_tags'].items():
                     content_str = content[:50] + "..." if len(content) > 50 else content
-                    print(f"  {name}: {content_str}", flush=True)
+                    lines.append(f"  {name}: {content_str}")
             else:
-                print("\nメタタグ: (なし)", flush=True)
+                lines.append("\nメタタグ: (なし)")
             
-            print("=" * 60 + "\n", flush=True)
+            lines.append("=" * 60 + "\n")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
         except Exception as e:
             print(f"エラー: 構造情報の取得中に問題が発生しました: {e}", flush=True)
             import traceback
@@ -293,12 +737,27 @@ class HTMLEditor:
     
     def export_to_json(self, output_path: str):
         """構造情報をJSONファイルにエクスポート"""
+        # 構造情報・リンク・画像は1回の走査でまとめて集計される（DOMを変更するまで集計結果を再利用する）
+        # 書き出すだけで変更しないため、リンク・画像はget_all_links等のようにコピーせずに渡す
+        links, images, _ = self._collect_all()
         info = self.get_structure_info()
-        info['links'] = self.get_all_links()
-        info['images'] = self.get_all_images()
+        info['links'] = links
+        info['images'] = images
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(info, f, ensure_ascii=False, indent=2)
+        # orjsonが利用できる場合は、C実装でバイト列にしてそのまま書き込む（出力内容はjson.dumpと同じ）
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(info, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # orjsonで扱えない値が含まれる場合は標準のjsonで出力する
+                pass
+        
+        if payload is not None:
+            Path(output_path).write_bytes(payload)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(info, f, ensure_ascii=False, indent=2)
         
         print(f"JSONファイルを保存しました: {output_path}")
     
@@ -312,16 +771,21 @@ class HTMLEditor:
         errors = []
         
         try:
-            # HTMLファイルの内容を取得
-            with open(self.html_file_path, 'r', encoding=self.encoding) as f:
-                content = f.read()
-                lines = content.split('\n')
+            # HTMLファイルの内容を取得（読み込み後にファイルが更新された場合のみ読み直す）
+            if self._raw_content is None or self._file_changed():
+                self._read_file()
+            elif self._validation_errors is not None:
+                # ファイルが更新されていなければ前回の結果を返す
+                return [dict(error) for error in self._validation_errors]
+            content = self._raw_content
+            lines = self._lines
             
             # 基本的な構文チェック
             errors.extend(self._check_basic_syntax(content, lines))
             
             # BeautifulSoupでパースしてエラーを検出
-            errors.extend(self._check_parsing_errors(content, lines))
+            errors.extend(self._check_parse_warnings(content))
+            errors.extend(_check_strict_parsing(content))
             
             # タグの整合性チェック
             errors.extend(self._check_tag_consistency(content, lines))
@@ -329,6 +793,7 @@ class HTMLEditor:
             # 属性のチェック
             errors.extend(self._check_attributes(content, lines))
             
+            self._validation_errors = [dict(error) for error in errors]
         except Exception as e:
             errors.append({
                 'type': 'error',
@@ -353,84 +818,68 @@ class HTMLEditor:
             })
         
         # 属性値の引用符チェック
+        # タグの開始から終了までを正規表現で一度に走査し、閉じられていないタグ・引用符を検出する
         for line_num, line in enumerate(lines, 1):
-            # タグ内で引用符が閉じられていない場合を検出
-            # タグの開始から終了までを追跡
-            i = 0
-            while i < len(line):
-                if line[i] == '<' and (i == 0 or line[i-1] != '\\'):
-                    tag_start = i
-                    i += 1
-                    in_tag = True
-                    in_quote = False
-                    quote_char = None
-                    
-                    while i < len(line) and in_tag:
-                        char = line[i]
-                        if not in_quote:
-                            if char == '>':
-                                in_tag = False
-                            elif char in ['"', "'"]:
-                                in_quote = True
-                                quote_char = char
-                        else:
-                            if char == quote_char and (i == 0 or line[i-1] != '\\'):
-                                in_quote = False
-                                quote_char = None
-                        i += 1
-                    
-                    # タグが閉じられていない、または引用符が閉じられていない
-                    if in_tag or in_quote:
-                        if in_quote:
-                            errors.append({
-                                'type': 'error',
-                                'message': f'属性値の引用符が閉じられていません',
-                                'line': line_num,
-                                'column': tag_start
-                            })
-                        elif in_tag:
-                            errors.append({
-                                'type': 'error',
-                                'message': f'タグが正しく閉じられていません（引用符が閉じられていない可能性があります）',
-                                'line': line_num,
-                                'column': tag_start
-                            })
+            if '<' not in line:
+                continue
+            for match in _TAG_SCAN_RE.finditer(line):
+                if match.group('close'):
+                    continue
+                # タグが閉じられていない、または引用符が閉じられていない
+                if match.group('quote'):
+                    errors.append({
+                        'type': 'error',
+                        'message': f'属性値の引用符が閉じられていません',
+                        'line': line_num,
+                        'column': match.start()
+                    })
                 else:
-                    i += 1
+                    errors.append({
+                        'type': 'error',
+                        'message': f'タグが正しく閉じられていません（引用符が閉じられていない可能性があります）',
+                        'line': line_num,
+                        'column': match.start()
+                    })
         
         # 閉じタグの基本的なチェック
         open_tags = []
-        tag_pattern = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>')
+        # open_tagsに含まれるタグ名の個数（存在チェックをリスト走査せずに行うため）
+        open_counts = Counter()
         
-        for line_num, line in enumerate(lines, 1):
-            for match in tag_pattern.finditer(line):
-                is_closing = match.group(1) == '/'
-                tag_name = match.group(2).lower()
-                
-                # 自己完結型タグはスキップ
-                if tag_name in ['br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr']:
-                    continue
-                
-                if is_closing:
-                    if not open_tags or open_tags[-1] != tag_name:
-                        if tag_name in open_tags:
-                            errors.append({
-                                'type': 'error',
-                                'message': f'閉じタグの順序が不正です: </{tag_name}>',
-                                'line': line_num,
-                                'column': match.start()
-                            })
-                        else:
-                            errors.append({
-                                'type': 'error',
-                                'message': f'対応する開始タグが見つかりません: </{tag_name}>',
-                                'line': line_num,
-                                'column': match.start()
-                            })
+        # 行ごとではなく内容全体を一度に走査し、行番号・列はエラーのときだけ求める
+        line_starts = _line_starts(lines)
+        
+        for match in _TAG_RE.finditer(content):
+            is_closing = match.group(1) == '/'
+            tag_name = match.group(2).lower()
+            
+            # 自己完結型タグはスキップ
+            if tag_name in _VOID_TAGS:
+                continue
+            
+            if is_closing:
+                if not open_tags or open_tags[-1] != tag_name:
+                    line_num, column = _line_col(line_starts, match.start())
+                    if open_counts[tag_name]:
+                        errors.append({
+                            'type': 'error',
+                            'message': f'閉じタグの順序が不正です: </{tag_name}>',
+                            'line': line_num,
+                            'column': column
+                        })
                     else:
-                        open_tags.pop()
+                        errors.append({
+                            'type': 'error',
+                            'message': f'対応する開始タグが見つかりません: </{tag_name}>',
+                            'line': line_num,
+                            'column': column
+                        })
                 else:
-                    open_tags.append(tag_name)
+                    open_tags.pop()
+                    open_counts[tag_name] -= 1
+            else:
+                open_tags.append(tag_name)
+                open_counts[tag_name] += 1
         
         # 閉じられていないタグをチェック
         for tag in open_tags:
@@ -443,36 +892,44 @@ class HTMLEditor:
         
         return errors
     
-    def _check_parsing_errors(self, content: str, lines: List[str]) -> List[Dict[str, Any]]:
-        """BeautifulSoupでのパースエラーをチェック"""
+    def _check_parse_warnings(self, content: str) -> List[Dict[str, Any]]:
+        """BeautifulSoupでパースしたときの警告をチェック"""
         errors = []
         
-        # まずhtml.parserでチェック
         try:
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # 警告をエラーとして記録
-                for warning in w:
-                    if issubclass(warning.category, UserWarning):
-                        # 行番号を推定
-                        line_num = 1
-                        if hasattr(warning, 'lineno'):
-                            line_num = warning.lineno
-                        else:
-                            # メッセージから行番号を抽出を試みる
-                            msg = str(warning.message)
-                            match = re.search(r'line\s+(\d+)', msg, re.IGNORECASE)
-                            if match:
-                                line_num = int(match.group(1))
-                        
-                        errors.append({
-                            'type': 'warning',
-                            'message': str(warning.message),
-                            'line': line_num,
-                            'column': 0
-                        })
+            if self._source is not None and self._source is content and self.parse_only is None:
+                # soupが未解析なら、ここで解析してsoupと警告の両方に使う
+                self._parse_source()
+            if self._parse_warnings is not None and content is self._raw_content:
+                # 読み込み時と同じ内容なので、読み込み時のパース警告を再利用する（再パースしない）
+                w = self._parse_warnings
+            else:
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter("always")
+                    self._parse(content)
+                if content is self._raw_content:
+                    self._parse_warnings = w
+            
+            # 警告をエラーとして記録
+            for warning in w:
+                if issubclass(warning.category, UserWarning):
+                    # 行番号を推定
+                    line_num = 1
+                    if hasattr(warning, 'lineno'):
+                        line_num = warning.lineno
+                    else:
+                        # メッセージから行番号を抽出を試みる
+                        msg = str(warning.message)
+                        match = _WARN_LINE_RE.search(msg)
+                        if match:
+                            line_num = int(match.group(1))
+                    
+                    errors.append({
+                        'type': 'warning',
+                        'message': str(warning.message),
+                        'line': line_num,
+                        'column': 0
+                    })
         except Exception as e:
             errors.append({
                 'type': 'error',
@@ -481,41 +938,19 @@ class HTMLEditor:
                 'column': 0
             })
         
-        # lxmlパーサーが利用可能な場合は、より厳密なチェックを実行
-        try:
-            from lxml import etree
-            from lxml.html import HTMLParser
-            
-            parser = HTMLParser(recover=False, encoding='utf-8')
-            try:
-                etree.fromstring(content.encode('utf-8'), parser=parser)
-            except etree.XMLSyntaxError as e:
-                # lxmlのエラーメッセージから行番号を取得
-                line_num = getattr(e, 'lineno', 1)
-                column = getattr(e, 'offset', 0)
-                errors.append({
-                    'type': 'error',
-                    'message': f'XML構文エラー: {str(e)}',
-                    'line': line_num,
-                    'column': column
-                })
-        except ImportError:
-            # lxmlがインストールされていない場合はスキップ
-            pass
-        except Exception as e:
-            # lxmlでのチェック中にエラーが発生した場合は無視（html.parserの結果を優先）
-            pass
-        
         return errors
     
     def _check_tag_consistency(self, content: str, lines: List[str]) -> List[Dict[str, Any]]:
         """タグの整合性をチェック"""
         errors = []
         
+        # 内容は一度だけ小文字化し、以降の検索はすべて小文字化した内容に対して行う
+        lower = content.lower()
+        
         # html, head, bodyタグのチェック
-        has_html = re.search(r'<html[^>]*>', content, re.IGNORECASE)
-        has_head = re.search(r'<head[^>]*>', content, re.IGNORECASE)
-        has_body = re.search(r'<body[^>]*>', content, re.IGNORECASE)
+        has_html = _HTML_RE.search(lower)
+        has_head = _HEAD_RE.search(lower)
+        has_body = _BODY_RE.search(lower)
         
         if has_html and not has_head:
             errors.append({
@@ -535,10 +970,10 @@ class HTMLEditor:
         
         # titleタグのチェック（head内にあるべき）
         if has_head:
-            head_end = content.find('</head>', content.find('<head'))
+            head_start = lower.find('<head')
+            head_end = lower.find('</head>', head_start)
             if head_end > 0:
-                head_content = content[content.find('<head'):head_end]
-                if '<title' not in head_content.lower():
+                if '<title' not in lower[head_start:head_end]:
                     errors.append({
                         'type': 'warning',
                         'message': '<head>タグ内に<title>タグが見つかりません。SEOのため追加することを推奨します。',
@@ -552,31 +987,31 @@ class HTMLEditor:
         """属性のチェック"""
         errors = []
         
+        # 内容全体を一度に走査し、行番号・列は警告のときだけ求める
+        line_starts = _line_starts(lines)
+        
         # imgタグのalt属性チェック
-        img_pattern = re.compile(r'<img[^>]*>', re.IGNORECASE)
-        for line_num, line in enumerate(lines, 1):
-            for match in img_pattern.finditer(line):
-                img_tag = match.group(0)
-                if 'alt=' not in img_tag.lower():
-                    errors.append({
-                        'type': 'warning',
-                        'message': '<img>タグにalt属性がありません。アクセシビリティのため追加することを推奨します。',
-                        'line': line_num,
-                        'column': match.start()
-                    })
+        for match in _IMG_TAG_RE.finditer(content):
+            if 'alt=' not in match.group(0).lower():
+                line_num, column = _line_col(line_starts, match.start())
+                errors.append({
+                    'type': 'warning',
+                    'message': '<img>タグにalt属性がありません。アクセシビリティのため追加することを推奨します。',
+                    'line': line_num,
+                    'column': column
+                })
         
         # aタグのhref属性チェック
-        a_pattern = re.compile(r'<a[^>]*>', re.IGNORECASE)
-        for line_num, line in enumerate(lines, 1):
-            for match in a_pattern.finditer(line):
-                a_tag = match.group(0)
-                if 'href=' not in a_tag.lower() and 'name=' not in a_tag.lower():
-                    errors.append({
-                        'type': 'warning',
-                        'message': '<a>タグにhref属性またはname属性がありません。',
-                        'line': line_num,
-                        'column': match.start()
-                    })
+        for match in _A_TAG_RE.finditer(content):
+            a_tag = match.group(0).lower()
+            if 'href=' not in a_tag and 'name=' not in a_tag:
+                line_num, column = _line_col(line_starts, match.start())
+                errors.append({
+                    'type': 'warning',
+                    'message': '<a>タグにhref属性またはname属性がありません。',
+                    'line': line_num,
+                    'column': column
+                })
         
         return errors
 
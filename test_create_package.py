@@ -9,7 +9,9 @@ import tempfile
 import os
 import shutil
 from pathlib import Path
-from create_package import create_package, INCLUDE_FILES, EXCLUDE_PATTERNS
+from create_package import (
+    create_package, INCLUDE_FILES, INCLUDE_FILES_SET, EXCLUDE_PATTERNS, _EXCLUDE_RE, _package_ignore
+)
 
 
 class TestCreatePackage(unittest.TestCase):
@@ -66,6 +68,9 @@ class TestCreatePackage(unittest.TestCase):
         self.assertGreater(len(INCLUDE_FILES), 0)
         self.assertIn('web_html_editor.py', INCLUDE_FILES)
         self.assertIn('html_editor.py', INCLUDE_FILES)
+        self.assertEqual(INCLUDE_FILES_SET, frozenset(INCLUDE_FILES))
+        self.assertIn('web_html_editor.py', INCLUDE_FILES_SET)
+        self.assertIn('html_editor.py', INCLUDE_FILES_SET)
     
     def test_exclude_patterns_list(self):
         """EXCLUDE_PATTERNSリストのテスト"""
@@ -73,6 +78,12 @@ class TestCreatePackage(unittest.TestCase):
         self.assertGreater(len(EXCLUDE_PATTERNS), 0)
         self.assertIn('__pycache__', EXCLUDE_PATTERNS)
         self.assertIn('venv', EXCLUDE_PATTERNS)
+        # _package_ignoreが使う正規表現が、名前の完全一致とワイルドカードの両方を判定できること
+        self.assertTrue(_EXCLUDE_RE.match('__pycache__'))
+        self.assertTrue(_EXCLUDE_RE.match('venv'))
+        self.assertTrue(_EXCLUDE_RE.match('module.pyc'))
+        self.assertFalse(_EXCLUDE_RE.match('venv2'))
+        self.assertFalse(_EXCLUDE_RE.match('web_html_editor.py'))
     
     def test_create_package_basic(self):
         """基本的なパッケージ作成のテスト"""
@@ -138,6 +149,22 @@ class TestCreatePackage(unittest.TestCase):
         for item_name in self.excluded_items.keys():
             self.assertNotIn(item_name, files_in_package)
     
+    def test_package_ignore(self):
+        """copytree用ignore関数のテスト"""
+        package_dir = os.path.join(self.temp_dir, 'html_editor_package')
+        shutil.copytree(self.test_source_dir, package_dir,
+                        ignore=_package_ignore(self.test_source_dir))
+        
+        files_in_package = os.listdir(package_dir)
+        
+        # 必須ファイル・オプションファイルが含まれていることを確認
+        for filename in self.test_files:
+            self.assertIn(filename, files_in_package)
+        
+        # 除外されたファイルが含まれていないことを確認
+        for item_name in self.excluded_items.keys():
+            self.assertNotIn(item_name, files_in_package)
+    
     def test_file_content_preserved(self):
         """ファイル内容が保持されることをテスト"""
         package_dir = os.path.join(self.temp_dir, 'html_editor_package')
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+html_edit_interactive.pyのテスト
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from html_editor import HTMLEditor
+from html_edit_interactive import _parse_fragment, edit_element_by_id
+
+
+class TestEditElementById(unittest.TestCase):
+    """edit_element_by_idのHTMLコンテンツ変更のテストクラス"""
+    
+    def setUp(self):
+        """各テストの前に実行されるセットアップ"""
+        self.editor = HTMLEditor.from_string(
+            '<html><head><title>Test</title></head>'
+            '<body><div id="target"><p>old</p></div></body></html>'
+        )
+    
+    def _replace_content(self, new_html):
+        """IDで要素を選び、HTMLコンテンツを変更する（入力と出力はテスト内で置き換える）"""
+        with mock.patch('builtins.input', side_effect=['target', '3', new_html]):
+            with redirect_stdout(io.StringIO()):
+                edit_element_by_id(self.editor)
+        return self.editor.find_by_id('target')
+    
+    def test_fragment_starting_with_script(self):
+        """先頭が<script>の断片でも、すべてのノードが順序どおりに挿入されることをテスト"""
+        element = self._replace_content('<script>x</script><div>y</div>')
+        self.assertEqual(element.decode_contents(), '<script>x</script><div>y</div>')
+    
+    def test_head_only_fragment(self):
+        """<link>や<title>だけの断片が<html>で包まれずに挿入されることをテスト"""
+        element = self._replace_content('<link rel="stylesheet" href="a.css"/><title>t</title>')
+        self.assertEqual(
+            element.decode_contents(),
+            '<link href="a.css" rel="stylesheet"/><title>t</title>'
+        )
+        self.assertIsNone(element.find('html'))
+    
+    def test_parse_fragment(self):
+        """断片のトップレベルのノードがそのまま返されることをテスト"""
+        nodes = _parse_fragment('<meta charset="utf-8"/>text<p>p</p>')
+        self.assertEqual([str(node) for node in nodes], ['<meta charset="utf-8"/>', 'text', '<p>p</p>'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,23 +5,25 @@ HTMLEditorクラスのテスト
 """
 
 import unittest
+import copy
 import tempfile
 import os
 from pathlib import Path
+from unittest import mock
+from bs4 import SoupStrainer
+import html_editor
 from html_editor import HTMLEditor
 
+# テストではC拡張のlxmlで解析する（インストールされていない場合はhtml.parser）
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
 
-class TestHTMLEditor(unittest.TestCase):
-    """HTMLEditorクラスのテストクラス"""
-    
-    def setUp(self):
-        """各テストの前に実行されるセットアップ"""
-        # 一時的なHTMLファイルを作成
-        self.temp_dir = tempfile.mkdtemp()
-        self.html_file = os.path.join(self.temp_dir, 'test.html')
-        
-        # テスト用のHTMLコンテンツ
-        self.html_content = """<!DOCTYPE html>
+
+# テスト用のHTMLコンテンツ（ファイルへの書き込み用にエンコード済みのバイト列も保持する）
+_FIXTURE_HTML = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -43,33 +45,99 @@ class TestHTMLEditor(unittest.TestCase):
     <link rel="stylesheet" href="style.css">
 </body>
 </html>"""
+_FIXTURE_BYTES = _FIXTURE_HTML.encode('utf-8')
+
+
+class TestHTMLEditor(unittest.TestCase):
+    """HTMLEditorクラスのテストクラス"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """テストクラスの最初に1回だけ実行されるセットアップ"""
+        # テスト用のHTMLファイルはクラスで1つだけ作成する（読み取り専用のテストで共有）
+        cls._class_temp = tempfile.TemporaryDirectory()
+        cls.class_temp_dir = cls._class_temp.name
+        cls.html_file = os.path.join(cls.class_temp_dir, 'test.html')
         
-        # HTMLファイルを書き込み
-        with open(self.html_file, 'w', encoding='utf-8') as f:
-            f.write(self.html_content)
+        cls.html_content = _FIXTURE_HTML
+        Path(cls.html_file).write_bytes(_FIXTURE_BYTES)
+        
+        # DOMを変更しないテストは、解析済みのエディタを共有する（ファイルを読み込む処理は初期化のテストで確認する）
+        cls.editor = HTMLEditor.from_string(cls.html_content, parser=PARSER)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テストクラスの最後に1回だけ実行されるクリーンアップ"""
+        # テストごとの一時ディレクトリもクラスの一時ディレクトリ内にあるため、まとめて削除する
+        cls._class_temp.cleanup()
     
-    def tearDown(self):
-        """各テストの後に実行されるクリーンアップ"""
-        # 一時ファイルを削除
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def _mutable_editor(self):
+        """DOMを変更するテスト用のエディタを作成（共有エディタの解析済みsoupを複製し、再解析しない）"""
+        editor = HTMLEditor.from_string(self.html_content, parser=PARSER)
+        editor.soup = copy.copy(self.editor.soup)
+        return editor
+    
+    def _make_temp_dir(self):
+        """ファイルを書き込むテスト用の一時ディレクトリを作成（テストクラスの終了時にまとめて削除）"""
+        return tempfile.mkdtemp(dir=self.class_temp_dir)
+    
+    def _copy_fixture(self):
+        """元のファイルを書き換えるテスト用に、テスト用HTMLファイルを一時ディレクトリに作成"""
+        html_file = os.path.join(self._make_temp_dir(), 'test.html')
+        Path(html_file).write_bytes(_FIXTURE_BYTES)
+        return html_file
     
     def test_init(self):
         """初期化のテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = HTMLEditor(self.html_file, parser=PARSER)
         self.assertIsNotNone(editor.soup)
         self.assertEqual(editor.html_file_path, Path(self.html_file))
         self.assertEqual(editor.encoding, 'utf-8')
+        self.assertEqual(editor.parser, PARSER)
+    
+    def test_init_parser_fallback(self):
+        """利用できないパーサー指定時にhtml.parserへ切り替わるテスト"""
+        editor = HTMLEditor(self.html_file, parser='no-such-parser')
+        self.assertEqual(editor.parser, 'html.parser')
+        self.assertEqual(editor.get_title(), 'Test Title')
+    
+    def test_init_parse_only(self):
+        """SoupStrainerで一部だけを読み込むテスト"""
+        editor = HTMLEditor(self.html_file, parser=PARSER, parse_only=SoupStrainer('head'))
+        self.assertEqual(editor.get_title(), 'Test Title')
+        self.assertEqual(editor.get_meta('description'), 'Test description')
+        self.assertIsNone(editor.find_by_id('main-content'))
+        self.assertEqual(editor.get_all_links(), [])
+    
+    def test_head_only(self):
+        """<head>内だけを読み込むエディタのテスト"""
+        editor = HTMLEditor.head_only(self.html_file, parser=PARSER)
+        self.assertEqual(editor.get_title(), 'Test Title')
+        self.assertEqual(editor.get_meta('og:title', attr='property'), 'Test OG Title')
+        self.assertEqual(editor.find_by_tag('div'), [])
+        
+        editor.set_title('New Title')
+        self.assertEqual(editor.get_title(), 'New Title')
     
     def test_init_file_not_found(self):
         """存在しないファイルでの初期化テスト"""
         with self.assertRaises(FileNotFoundError):
             HTMLEditor('nonexistent.html')
     
+    def test_from_string(self):
+        """HTML文字列からの初期化テスト"""
+        editor = HTMLEditor.from_string(self.html_content, parser=PARSER)
+        self.assertIsNone(editor.html_file_path)
+        self.assertEqual(editor.get_title(), 'Test Title')
+        self.assertEqual(editor.validate_html(), HTMLEditor(self.html_file, parser=PARSER).validate_html())
+        
+        # 元のファイルがないため、保存先の指定が必要
+        with self.assertRaises(ValueError):
+            editor.save()
+    
     def test_find_by_id(self):
         """IDで要素を検索するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         element = editor.find_by_id('main-content')
         self.assertIsNotNone(element)
         self.assertEqual(element.name, 'div')
@@ -79,7 +147,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_find_by_class(self):
         """クラス名で要素を検索するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         elements = editor.find_by_class('container')
         self.assertEqual(len(elements), 1)
         self.assertEqual(elements[0].name, 'div')
@@ -90,47 +158,64 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_find_by_class_with_tag(self):
         """タグ指定付きクラス検索のテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         elements = editor.find_by_class('link', tag='a')
         self.assertEqual(len(elements), 1)
         self.assertEqual(elements[0].name, 'a')
     
     def test_find_by_tag(self):
         """タグ名で要素を検索するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         elements = editor.find_by_tag('p')
         self.assertGreater(len(elements), 0)
         self.assertEqual(elements[0].name, 'p')
     
     def test_find_by_attribute(self):
         """属性で要素を検索するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         elements = editor.find_by_attribute('name', 'test-input')
         self.assertEqual(len(elements), 1)
         self.assertEqual(elements[0].name, 'input')
     
     def test_find_by_text(self):
         """テキストで要素を検索するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         elements = editor.find_by_text('Hello World')
         self.assertGreater(len(elements), 0)
     
     def test_get_title(self):
         """タイトルを取得するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         title = editor.get_title()
         self.assertEqual(title, 'Test Title')
     
+    def test_get_title_before_and_after_parse(self):
+        """soupの解析前後でタイトルの取得結果が一致するテスト"""
+        for html in ('<html><head><title> Spaced &amp; Escaped </title></head></html>',
+                     '<html><head><title></title></head></html>',
+                     '<html><body><p>No title</p></body></html>'):
+            editor = HTMLEditor.from_string(html, parser=PARSER)
+            title = editor.get_title()
+            editor.find_by_tag('p')
+            self.assertEqual(title, editor.get_title())
+    
+    def test_get_title_html_parser(self):
+        """html.parserで作成したエディタのタイトルがsoupの解析結果と一致するテスト"""
+        # lxmlはtitleの中身を文字列として読むが、html.parserはタグとして解析する
+        editor = HTMLEditor.from_string('<title>a</form><table></title>', parser='html.parser')
+        self.assertIsNone(editor.get_title())
+        self.assertIsNone(editor.soup.title.string)
+    
     def test_set_title(self):
         """タイトルを設定するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         editor.set_title('New Title')
         title = editor.get_title()
         self.assertEqual(title, 'New Title')
     
     def test_get_meta(self):
         """メタタグを取得するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         description = editor.get_meta('description')
         self.assertEqual(description, 'Test description')
         
@@ -139,14 +224,14 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_set_meta(self):
         """メタタグを設定するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         editor.set_meta('description', 'New Description')
         description = editor.get_meta('description')
         self.assertEqual(description, 'New Description')
     
     def test_get_all_links(self):
         """すべてのリンクを取得するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         links = editor.get_all_links()
         self.assertGreater(len(links), 0)
         self.assertEqual(links[0]['href'], 'https://example.com')
@@ -154,7 +239,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_get_all_images(self):
         """すべての画像を取得するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         images = editor.get_all_images()
         self.assertGreater(len(images), 0)
         self.assertEqual(images[0]['src'], 'test.jpg')
@@ -162,21 +247,21 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_update_text(self):
         """要素のテキストを更新するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         element = editor.find_by_id('test-link')
         editor.update_text(element, 'New Link Text')
         self.assertEqual(element.string, 'New Link Text')
     
     def test_update_attribute(self):
         """要素の属性を更新するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         element = editor.find_by_id('test-link')
         editor.update_attribute(element, 'href', 'https://newurl.com')
         self.assertEqual(element.get('href'), 'https://newurl.com')
     
     def test_add_element(self):
         """要素を追加するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         parent = editor.find_by_id('main-content')
         new_element = editor.add_element(parent, 'div', text='New Div', attrs={'id': 'new-div'})
         self.assertIsNotNone(new_element)
@@ -184,9 +269,61 @@ class TestHTMLEditor(unittest.TestCase):
         self.assertEqual(new_element.string, 'New Div')
         self.assertEqual(new_element.get('id'), 'new-div')
     
+    def test_get_all_links_after_add_element(self):
+        """要素追加後のリンク一覧に追加した要素が反映されるテスト"""
+        editor = self._mutable_editor()
+        self.assertEqual(len(editor.get_all_links()), 1)
+        parent = editor.find_by_id('main-content')
+        editor.add_element(parent, 'a', text='Added Link', attrs={'href': 'https://added.example'})
+        links = editor.get_all_links()
+        self.assertEqual(len(links), 2)
+        self.assertEqual(links[1]['href'], 'https://added.example')
+        self.assertEqual(editor.get_structure_info()['links_count'], 2)
+    
+    def test_get_all_links_after_nested_add_element(self):
+        """リンク内に要素を追加した後のリンク一覧がsoupの内容と一致するテスト"""
+        editor = HTMLEditor.from_string(
+            '<html><body><a href="#" id="outer">L</a></body></html>', parser=PARSER)
+        self.assertEqual(editor.get_all_links()[0]['text'], 'L')
+        
+        # 再解析すると入れ子のaタグは分割されるため、DOM変更後はsoupから集計する
+        editor.add_element(editor.find_by_id('outer'), 'a', text='inner')
+        links = editor.get_all_links()
+        self.assertEqual([link['text'] for link in links], ['Linner', 'inner'])
+        self.assertEqual(editor.get_structure_info()['links_count'], 2)
+    
+    def test_invalidate_after_direct_modification(self):
+        """要素を直接変更した後、invalidateで検索・集計結果が更新されるテスト"""
+        editor = self._mutable_editor()
+        element = editor.find_by_id('main-content')
+        self.assertEqual(len(editor.get_all_links()), 1)
+        
+        element['id'] = 'renamed'
+        element.append(editor.soup.new_tag('a', attrs={'href': '#added'}))
+        editor.invalidate()
+        
+        self.assertIsNone(editor.find_by_id('main-content'))
+        self.assertIs(editor.find_by_id('renamed'), element)
+        self.assertEqual(len(editor.get_all_links()), 2)
+        self.assertEqual(editor.get_structure_info()['links_count'], 2)
+    
+    def test_find_after_modification(self):
+        """DOM変更後の検索結果に変更が反映されるテスト"""
+        editor = self._mutable_editor()
+        parent = editor.find_by_id('main-content')
+        self.assertEqual(len(editor.find_by_tag('p')), 1)
+        
+        editor.add_element(parent, 'p', text='Added', attrs={'id': 'added-p'})
+        self.assertEqual(len(editor.find_by_tag('p')), 2)
+        self.assertIsNotNone(editor.find_by_id('added-p'))
+        
+        editor.remove_element(editor.find_by_id('test-link'))
+        self.assertIsNone(editor.find_by_id('test-link'))
+        self.assertEqual(editor.find_by_tag('a'), [])
+    
     def test_remove_element(self):
         """要素を削除するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         element = editor.find_by_id('test-link')
         editor.remove_element(element)
         element_after = editor.find_by_id('test-link')
@@ -194,7 +331,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_replace_element(self):
         """要素を置き換えるテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self._mutable_editor()
         old_element = editor.find_by_id('test-link')
         new_element = editor.replace_element(old_element, 'span', text='New Span', new_attrs={'id': 'new-span'})
         self.assertIsNotNone(new_element)
@@ -207,7 +344,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_get_structure_info(self):
         """構造情報を取得するテスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         info = editor.get_structure_info()
         self.assertEqual(info['title'], 'Test Title')
         self.assertEqual(info['links_count'], 1)
@@ -217,10 +354,52 @@ class TestHTMLEditor(unittest.TestCase):
         self.assertEqual(info['forms_count'], 1)
         self.assertIn('description', info['meta_tags'])
     
+    def test_get_structure_info_matches_soup(self):
+        """soupを解析せずに取得した構造情報がsoup解析後と一致するテスト"""
+        editor = HTMLEditor.from_string(
+            '<html><head><title></title></head><body><a href="#">Link</a></body></html>', parser=PARSER)
+        info = editor.get_structure_info()
+        self.assertIsNone(info['title'])
+        self.assertEqual(info['links_count'], 1)
+        
+        # soupを使う操作の後も同じ結果になる
+        editor.find_by_tag('a')
+        self.assertEqual(editor.get_structure_info(), info)
+        
+        info = self.editor.get_structure_info()
+        self.assertEqual(info['title'], self.editor.get_title())
+    
+    def test_get_all_links_ignores_script_text(self):
+        """リンク内のscript/styleの文字列がlxmlとBeautifulSoupのどちらの経路でも含まれないテスト"""
+        html = ('<html><body><a href="#">go<script>s()</script><style>a{}</style>'
+                ' <b>now</b></a></body></html>')
+        links = HTMLEditor.from_string(html, parser=PARSER).get_all_links()
+        self.assertEqual(links[0]['text'], 'gonow')
+        
+        # lxmlが使えない場合のBeautifulSoupの経路と同じ結果になる
+        with mock.patch.object(html_editor, 'etree', None):
+            soup_links = HTMLEditor.from_string(html, parser=PARSER).get_all_links()
+        self.assertEqual(soup_links, links)
+    
+    def test_get_all_links_html_parser(self):
+        """html.parserで作成したエディタのリンク・構造情報がsoupの解析結果と一致するテスト"""
+        # html.parserはaタグを入れ子のまま残し、lxmlは外側のaタグを閉じるため、解析結果が異なる
+        editor = HTMLEditor.from_string(
+            '<html><body><a href="x">A<a href="y">B</a></a><p><img src="i.png"></p></body></html>',
+            parser='html.parser')
+        links = editor.get_all_links()
+        self.assertEqual([link['text'] for link in links],
+                         [a.get_text(strip=True) for a in editor.soup.find_all('a')])
+        self.assertEqual([link['text'] for link in links], ['AB', 'B'])
+        info = editor.get_structure_info()
+        self.assertEqual(info['links_count'], len(editor.soup.find_all('a')))
+        self.assertEqual(info['images_count'], 1)
+    
     def test_save(self):
         """HTMLを保存するテスト"""
-        editor = HTMLEditor(self.html_file)
-        output_file = os.path.join(self.temp_dir, 'output.html')
+        temp_dir = self._make_temp_dir()
+        editor = self.editor
+        output_file = os.path.join(temp_dir, 'output.html')
         editor.save(output_path=output_file, pretty_print=True)
         self.assertTrue(os.path.exists(output_file))
         
@@ -229,20 +408,38 @@ class TestHTMLEditor(unittest.TestCase):
             saved_content = f.read()
         self.assertIn('Test Title', saved_content)
     
+    def test_save_with_encoding(self):
+        """指定したエンコーディングで保存するテスト"""
+        temp_dir = self._make_temp_dir()
+        sjis_file = os.path.join(temp_dir, 'sjis.html')
+        with open(sjis_file, 'w', encoding='shift_jis') as f:
+            f.write('<html><head><meta charset="shift_jis"><title>テスト</title></head><body><p>本文</p></body></html>')
+        
+        editor = HTMLEditor(sjis_file, encoding='shift_jis', parser=PARSER)
+        output_file = os.path.join(temp_dir, 'sjis_output.html')
+        editor.save(output_path=output_file, pretty_print=False)
+        
+        with open(output_file, 'r', encoding='shift_jis') as f:
+            saved_content = f.read()
+        self.assertIn('<title>テスト</title>', saved_content)
+        self.assertIn('charset="shift_jis"', saved_content)
+    
     def test_save_overwrite(self):
         """元のファイルに上書き保存するテスト"""
-        editor = HTMLEditor(self.html_file)
+        html_file = self._copy_fixture()
+        editor = HTMLEditor(html_file, parser=PARSER)
         editor.set_title('Updated Title')
         editor.save()
         
         # 再読み込みして確認
-        editor2 = HTMLEditor(self.html_file)
+        editor2 = HTMLEditor(html_file, parser=PARSER)
         self.assertEqual(editor2.get_title(), 'Updated Title')
     
     def test_export_to_json(self):
         """構造情報をJSONにエクスポートするテスト"""
-        editor = HTMLEditor(self.html_file)
-        json_file = os.path.join(self.temp_dir, 'structure.json')
+        temp_dir = self._make_temp_dir()
+        editor = self.editor
+        json_file = os.path.join(temp_dir, 'structure.json')
         editor.export_to_json(json_file)
         self.assertTrue(os.path.exists(json_file))
         
@@ -255,7 +452,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_validate_html_valid(self):
         """有効なHTMLの検証テスト"""
-        editor = HTMLEditor(self.html_file)
+        editor = self.editor
         errors = editor.validate_html()
         # 有効なHTMLなので、エラーは警告のみか、または空である可能性がある
         # エラーのタイプを確認
@@ -265,6 +462,7 @@ class TestHTMLEditor(unittest.TestCase):
     
     def test_validate_html_invalid(self):
         """無効なHTMLの検証テスト"""
+        temp_dir = self._make_temp_dir()
         # 閉じタグがないHTMLを作成
         invalid_html = """<!DOCTYPE html>
 <html>
@@ -275,16 +473,72 @@ class TestHTMLEditor(unittest.TestCase):
 </body>
 </html>"""
         
-        invalid_file = os.path.join(self.temp_dir, 'invalid.html')
+        invalid_file = os.path.join(temp_dir, 'invalid.html')
         with open(invalid_file, 'w', encoding='utf-8') as f:
             f.write(invalid_html)
         
-        editor = HTMLEditor(invalid_file)
+        editor = HTMLEditor(invalid_file, parser=PARSER)
         errors = editor.validate_html()
         # エラーが検出されることを確認
         self.assertIsInstance(errors, list)
         # 少なくとも1つのエラーまたは警告があることを確認
         self.assertGreater(len(errors), 0)
+    
+    def test_validate_html_uppercase_head_without_title(self):
+        """大文字のheadタグ内にtitleがない場合の検証テスト"""
+        editor = HTMLEditor.from_string('<!DOCTYPE html>\n<HTML>\n<HEAD>\n</HEAD>\n<BODY>\n</BODY>\n</HTML>',
+                                        parser=PARSER)
+        messages = [e['message'] for e in editor.validate_html()]
+        self.assertIn('<head>タグ内に<title>タグが見つかりません。SEOのため追加することを推奨します。', messages)
+    
+    def _attribute_warnings(self, body):
+        """本文を検証し、img・aタグの属性チェックの警告を (メッセージの先頭のタグ, 行番号) のリストで返す"""
+        editor = HTMLEditor.from_string(
+            f'<!DOCTYPE html>\n<html><head><title>t</title></head><body>\n{body}\n</body></html>', parser=PARSER)
+        return [(e['message'][:5], e['line']) for e in editor.validate_html()
+                if e['message'].startswith(('<img>タグ', '<a>タグ'))]
+    
+    def test_validate_html_multiline_tags(self):
+        """複数行にまたがるimg・aタグの次の行の属性が認識されるテスト"""
+        warnings = self._attribute_warnings(
+            '<img src="a.png"\n     alt="multi">\n<a class="x"\n   href="#">link</a>\n<img src="b.png"\n     title="t">')
+        self.assertEqual(warnings, [('<img>', 7)])
+    
+    def test_validate_html_brackets_in_attributes(self):
+        """属性値内の「<」や、imgで始まる別のタグ名で誤検出しないテスト"""
+        warnings = self._attribute_warnings(
+            '<a title="1 < 2" href="#">n</a>\n'
+            '<img src="b.png" title="<x" alt="y">\n'
+            '<abbr>x</abbr><area shape="rect">\n'
+            '<a>no href</a>')
+        self.assertEqual(warnings, [('<a>タグ', 6)])
+    
+    def test_validate_html_rereads_modified_file(self):
+        """読み込み後にファイルが更新された場合の検証テスト"""
+        html_file = self._copy_fixture()
+        editor = HTMLEditor(html_file, parser=PARSER)
+        first = editor.validate_html()
+        # 更新がなければ同じ結果を返す
+        self.assertEqual(editor.validate_html(), first)
+        
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write('<html><body><div>Unclosed div</body></html>')
+        os.utime(html_file, ns=(0, 0))
+        
+        messages = [e['message'] for e in editor.validate_html()]
+        self.assertIn('閉じタグの順序が不正です: </body>', messages)
+    
+    def test_validate_html_after_save(self):
+        """保存して元のファイルを書き換えた後の検証テスト"""
+        html_file = self._copy_fixture()
+        editor = HTMLEditor(html_file, parser=PARSER)
+        editor.validate_html()
+        
+        editor.add_element(editor.find_by_id('main-content'), 'img', attrs={'src': 'new.jpg'})
+        editor.save(pretty_print=False)
+        
+        messages = [e['message'] for e in editor.validate_html()]
+        self.assertIn('<img>タグにalt属性がありません。アクセシビリティのため追加することを推奨します。', messages)
 
 
 if __name__ == '__main__':
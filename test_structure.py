@@ -11,12 +11,14 @@ import io
 # Windowsでの日本語表示対応
 if sys.platform == 'win32':
     try:
-        import os
-        os.system('chcp 65001 >nul 2>&1')
-        if hasattr(sys.stdout, 'buffer'):
-            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        if hasattr(sys.stderr, 'buffer'):
-            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+        # コードページをUTF-8に変更（chcpのサブプロセスを起動せずAPIを直接呼ぶ）
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+        # すでにUTF-8の場合（PYTHONIOENCODING=utf-8やUTF-8モード）は包み直さない
+        for name in ('stdout', 'stderr'):
+            stream = getattr(sys, name)
+            if hasattr(stream, 'buffer') and (stream.encoding or '').lower().replace('-', '') != 'utf8':
+                setattr(sys, name, io.TextIOWrapper(stream.buffer, encoding='utf-8', errors='replace'))
     except Exception:
         pass
 
@@ -7,30 +7,28 @@ web_html_editor.pyのFlaskアプリケーションのテスト
 import unittest
 import tempfile
 import os
+import io
 import json
+import sqlite3
 from pathlib import Path
+from flask.testing import FlaskClient
 from werkzeug.test import Client
 from werkzeug.wrappers import Response
-from web_html_editor import app
+import web_html_editor
+from web_html_editor import app, init_database, session_files
+from html_editor import HTMLEditor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class TestWebHTMLEditor(unittest.TestCase):
-    """web_html_editor.pyのFlaskアプリケーションのテストクラス"""
-    
-    def setUp(self):
-        """各テストの前に実行されるセットアップ"""
-        # Flaskテストクライアントを作成
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SECRET_KEY'] = 'test-secret-key'
-        
-        # 一時ディレクトリを作成
-        self.temp_dir = tempfile.mkdtemp()
-        self.app.config['UPLOAD_FOLDER'] = self.temp_dir
-        
-        # テスト用のHTMLファイルを作成
-        self.html_file = os.path.join(self.temp_dir, 'test.html')
-        self.html_content = """<!DOCTYPE html>
+
+# 一時ディレクトリの作成先（Linuxではメモリ上のファイルシステムの/dev/shmを使い、ディスクへの書き込みを避ける）
+_TEMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# テスト用のHTMLコンテンツ（ファイルへの書き込み用にエンコード済みのバイト列も保持する）
+_FIXTURE_HTML = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -44,110 +42,217 @@ class TestWebHTMLEditor(unittest.TestCase):
     </div>
 </body>
 </html>"""
+_FIXTURE_BYTES = _FIXTURE_HTML.encode('utf-8')
+
+# 差分検出・テンプレート統合で比較するHTMLファイルの内容（番号と見出しの色だけが異なる）
+_COMPARISON_TEMPLATE = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <title>Test %(number)d</title>
+    <style>
+        .header { color: %(color)s; }
+    </style>
+</head>
+<body>
+    <div id="header" class="header">
+        <h1>Header %(number)d</h1>
+    </div>
+</body>
+</html>"""
+_COMPARISON_BYTES1 = (_COMPARISON_TEMPLATE % {'number': 1, 'color': 'blue'}).encode('utf-8')
+_COMPARISON_BYTES2 = (_COMPARISON_TEMPLATE % {'number': 2, 'color': 'red'}).encode('utf-8')
+
+
+class _BufferedClient(FlaskClient):
+    """レスポンスの本文をリクエスト時に読み切って閉じるテストクライアント（送信したファイルのハンドルを残さない）"""
+    
+    def open(self, *args, buffered=True, **kwargs):
+        return super().open(*args, buffered=buffered, **kwargs)
+
+
+# テスト中のアプリの設定（UPLOAD_FOLDERは各テストクラスの一時ディレクトリに変更する）
+_TEST_CONFIG = {
+    'TESTING': True,
+    'SECRET_KEY': 'test-secret-key',
+}
+_original_config = {}
+
+
+def setUpModule():
+    """モジュールの最初に1回だけアプリの設定を変更（元の設定はtearDownModuleで戻す）"""
+    _original_config.update(
+        (key, app.config[key]) for key in (*_TEST_CONFIG, 'UPLOAD_FOLDER')
+    )
+    app.config.update(_TEST_CONFIG)
+
+
+def tearDownModule():
+    """モジュールの最後に1回だけアプリの設定を元に戻す"""
+    app.config.update(_original_config)
+    _original_config.clear()
+
+
+# モジュール全体で共有するテストクライアント
+_CLIENT = _BufferedClient(app, app.response_class, use_cookies=True)
+
+
+def _shared_client():
+    """共有のテストクライアントを取得（前のテストのセッションを引き継がないよう、セッションのCookieを削除する）"""
+    _CLIENT.delete_cookie(app.config['SESSION_COOKIE_NAME'])
+    return _CLIENT
+
+
+# レスポンスのJSONの読み込み（orjsonが利用できる場合はC実装を使う）
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_body(data):
+    """リクエストボディ用にJSONのバイト列を作成"""
+    return json.dumps(data).encode('utf-8')
+
+
+# 差分検出・テンプレート統合のオプション（すべて有効）
+_DIFF_OPTIONS = {
+    'structure': True,
+    'styles': True,
+    'content': True,
+    'attributes': True
+}
+_MERGE_OPTIONS = {
+    'merge_html': True,
+    'merge_css': True,
+    'merge_content': True,
+    'merge_attributes': True
+}
+
+# 内容が変わらないリクエストボディ（テストごとにJSONへ変換しないよう、読み込み時に1回だけ作成する）
+_EMPTY_HTML_SAVE_BODY = _json_body({'content': '<html></html>'})
+_SAVE_BODY = _json_body({'content': '<html><head><title>New Title</title></head><body>New Content</body></html>'})
+_SEARCH_BODY = _json_body({'query': 'main-content'})
+_EMPTY_SEARCH_BODY = _json_body({'query': ''})
+_VALIDATE_BODY = _json_body({'content': _FIXTURE_HTML})
+_EMPTY_DIRECTORY_DIFF_BODY = _json_body({'directory': '', 'options': _DIFF_OPTIONS})
+_NO_FILES_MERGE_BODY = _json_body({'files': [], 'options': _MERGE_OPTIONS})
+_UNIVERSITY_BODY = _json_body({'code': 'TEST001', 'name': 'Test University'})
+_DUPLICATE_UNIVERSITY_BODY = _json_body({'code': 'TEST001', 'name': 'Test University 2'})
+_MISSING_NAME_UNIVERSITY_BODY = _json_body({'code': 'TEST001'})  # nameが欠けている
+
+# HTMLのレスポンスから検索する文字列（レスポンスのバイト列と比較するためエンコードしておく）
+_EDITOR_TITLE_BYTES = 'HTMLエディタ'.encode('utf-8')
+_FIXTURE_TITLE_BYTES = 'Test Title'.encode('utf-8')
+
+
+class TestWebHTMLEditor(unittest.TestCase):
+    """web_html_editor.pyのFlaskアプリケーションのテストクラス"""
+    
+    # ファイル情報を設定するテストで使うセッションID
+    SESSION_ID = '0' * 32
+    
+    @classmethod
+    def setUpClass(cls):
+        """テストクラスの最初に1回だけ実行されるセットアップ"""
+        cls.app = app
+        
+        # 一時ディレクトリを作成（ファイルを書き換えないテストで共有）
+        cls._class_temp = tempfile.TemporaryDirectory(dir=_TEMP_ROOT)
+        cls.temp_dir = cls._class_temp.name
+        cls.app.config['UPLOAD_FOLDER'] = cls.temp_dir
+        
+        # ファイルのアップロード・読み込み・削除のルートも一時ディレクトリを使う
+        cls.original_upload_dir = web_html_editor.UPLOAD_DIR
+        web_html_editor.UPLOAD_DIR = Path(cls.temp_dir)
+        
+        # テスト用のHTMLファイルを作成
+        cls.html_file = os.path.join(cls.temp_dir, 'test.html')
+        cls.html_content = _FIXTURE_HTML
+        Path(cls.html_file).write_bytes(_FIXTURE_BYTES)
         
-        with open(self.html_file, 'w', encoding='utf-8') as f:
-            f.write(self.html_content)
+        # セッションに設定するエディタ（ルートはエディタのDOMを変更しないため、テスト間で共有する）
+        cls.editor = HTMLEditor(cls.html_file)
         
-        self.client = self.app.test_client()
+        # セッションIDを固定し、署名済みのセッションCookieを1回だけ作成する
+        # （テストごとのsession_transactionによるCookieの読み込み・署名を省く）
+        serializer = cls.app.session_interface.get_signing_serializer(cls.app)
+        cls.session_cookie = serializer.dumps({'session_id': cls.SESSION_ID})
     
-    def tearDown(self):
-        """各テストの後に実行されるクリーンアップ"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """テストクラスの最後に1回だけ実行されるクリーンアップ"""
+        session_files.pop(cls.SESSION_ID, None)
+        web_html_editor.UPLOAD_DIR = cls.original_upload_dir
+        cls._class_temp.cleanup()
+    
+    def setUp(self):
+        """各テストの前に実行されるセットアップ"""
+        self.client = _shared_client()
+    
+    def _seed_session(self, editor=None, html_file=None):
+        """テストクライアントのセッションにファイル情報を設定（省略時は共有のエディタとテスト用HTMLファイル）"""
+        session_files[self.SESSION_ID] = {
+            'html_editor': editor if editor is not None else self.editor,
+            'html_file_path': html_file if html_file is not None else self.html_file
+        }
+        self.client.set_cookie(self.app.config['SESSION_COOKIE_NAME'], self.session_cookie)
     
     def test_index_route(self):
         """メインページのルートテスト"""
         response = self.client.get('/')
         self.assertEqual(response.status_code, 200)
-        # 日本語はエンコードして検索
-        self.assertIn('HTMLエディタ'.encode('utf-8'), response.data)
+        # 日本語はエンコード済みのバイト列で検索
+        self.assertIn(_EDITOR_TITLE_BYTES, response.data)
     
     def test_index_with_session_file(self):
         """セッションにファイルがある場合のメインページテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.get('/')
         self.assertEqual(response.status_code, 200)
-        self.assertIn('Test Title'.encode('utf-8'), response.data)
+        self.assertIn(_FIXTURE_TITLE_BYTES, response.data)
     
     def test_content_route_no_file(self):
         """ファイルが選択されていない場合のcontentルートテスト"""
         response = self.client.get('/content')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
         self.assertIn('ファイルが選択されていません', data['error'])
     
     def test_content_route_with_file(self):
         """ファイルが選択されている場合のcontentルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.get('/content')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('Test Title', data['content'])
     
     def test_save_route_no_file(self):
         """ファイルが選択されていない場合のsaveルートテスト"""
         response = self.client.post('/save', 
-                                   data=json.dumps({'content': '<html></html>'}),
+                                   data=_EMPTY_HTML_SAVE_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_save_route_with_file(self):
         """ファイルが選択されている場合のsaveルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        # ファイルを書き換えるため、共有のテスト用HTMLファイルとは別に作成する
+        html_file = os.path.join(tempfile.mkdtemp(dir=self.temp_dir), 'test.html')
+        Path(html_file).write_bytes(_FIXTURE_BYTES)
+        self._seed_session(HTMLEditor(html_file), html_file)
         
-        new_content = '<html><head><title>New Title</title></head><body>New Content</body></html>'
         response = self.client.post('/save',
-                                   data=json.dumps({'content': new_content}),
+                                   data=_SAVE_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         
         # ファイルが実際に保存されたことを確認
-        with open(self.html_file, 'r', encoding='utf-8') as f:
+        with open(html_file, 'r', encoding='utf-8') as f:
             saved_content = f.read()
         self.assertIn('New Title', saved_content)
     
@@ -155,28 +260,16 @@ class TestWebHTMLEditor(unittest.TestCase):
         """ファイルが選択されていない場合のreloadルートテスト"""
         response = self.client.get('/reload')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_reload_route_with_file(self):
         """ファイルが選択されている場合のreloadルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.get('/reload')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('Test Title', data['content'])
     
@@ -184,28 +277,16 @@ class TestWebHTMLEditor(unittest.TestCase):
         """エディタが初期化されていない場合のstructureルートテスト"""
         response = self.client.get('/structure')
         self.assertEqual(response.status_code, 500)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_structure_route_with_editor(self):
         """エディタが初期化されている場合のstructureルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.get('/structure')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('info', data)
         self.assertEqual(data['info']['title'], 'Test Title')
@@ -215,56 +296,32 @@ class TestWebHTMLEditor(unittest.TestCase):
     def test_search_route_no_editor(self):
         """エディタが初期化されていない場合のsearchルートテスト"""
         response = self.client.post('/search',
-                                   data=json.dumps({'query': 'main-content'}),
+                                   data=_SEARCH_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 500)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_search_route_empty_query(self):
         """空のクエリでのsearchルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.post('/search',
-                                   data=json.dumps({'query': ''}),
+                                   data=_EMPTY_SEARCH_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_search_route_by_id(self):
         """IDで検索するsearchルートテスト"""
-        from web_html_editor import session_files
-        from html_editor import HTMLEditor
-        import secrets
-        
-        with self.client.session_transaction() as sess:
-            session_id = secrets.token_hex(16)
-            sess['session_id'] = session_id
-            
-            editor = HTMLEditor(self.html_file)
-            session_files[session_id] = {
-                'html_editor': editor,
-                'html_file_path': self.html_file
-            }
+        self._seed_session()
         
         response = self.client.post('/search',
-                                   data=json.dumps({'query': 'main-content'}),
+                                   data=_SEARCH_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertGreater(len(data['results']), 0)
         self.assertEqual(data['results'][0]['id'], 'main-content')
@@ -272,20 +329,20 @@ class TestWebHTMLEditor(unittest.TestCase):
     def test_validate_route_no_content(self):
         """コンテンツがない場合のvalidateルートテスト"""
         response = self.client.post('/validate',
-                                   data=json.dumps({}),
+                                   data=b'{}',
                                    content_type='application/json')
         # コンテンツが空の場合は400が返る
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_validate_route_with_content(self):
         """コンテンツがある場合のvalidateルートテスト"""
         response = self.client.post('/validate',
-                                   data=json.dumps({'content': self.html_content}),
+                                   data=_VALIDATE_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('errors', data)
     
@@ -293,12 +350,11 @@ class TestWebHTMLEditor(unittest.TestCase):
         """ファイルがアップロードされていない場合のuploadルートテスト"""
         response = self.client.post('/upload')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_upload_route_with_file(self):
         """ファイルがアップロードされている場合のuploadルートテスト"""
-        import io
         # テスト用のHTMLファイルを準備
         test_html = '<html><head><title>Uploaded</title></head><body>Uploaded Content</body></html>'
         
@@ -306,7 +362,7 @@ class TestWebHTMLEditor(unittest.TestCase):
                                    data={'file': (io.BytesIO(test_html.encode('utf-8')), 'test_upload.html')},
                                    content_type='multipart/form-data')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('filename', data)
     
@@ -314,101 +370,93 @@ class TestWebHTMLEditor(unittest.TestCase):
         """filesルートテスト"""
         response = self.client.get('/files')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('files', data)
         self.assertIsInstance(data['files'], list)
     
     def test_load_file_route(self):
-        """load_fileルートテスト"""
-        response = self.client.get(f'/load/test.html')
-        # ファイルが存在しない場合は404または400
-        # ファイルが存在する場合は200
-        self.assertIn(response.status_code, [200, 400, 404])
+        """load_fileルートテスト（アップロードフォルダにあるファイル）"""
+        response = self.client.get('/load/test.html')
+        self.assertEqual(response.status_code, 200)
+        data = _loads(response.data)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['filename'], 'test.html')
+        self.assertIn('Test Title', data['content'])
+    
+    def test_load_file_route_missing(self):
+        """存在しないファイルでのload_fileルートテスト"""
+        response = self.client.get('/load/nonexistent.html')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(_loads(response.data)['success'])
     
     def test_delete_file_route(self):
-        """delete_fileルートテスト"""
-        # 存在しないファイルを削除しようとする
+        """delete_fileルートテスト（アップロードフォルダにあるファイル）"""
+        # 共有のテスト用HTMLファイルは残すため、削除用のファイルを作成する
+        delete_file = Path(self.temp_dir) / 'delete_me.html'
+        delete_file.write_bytes(_FIXTURE_BYTES)
+        
+        response = self.client.delete('/delete/delete_me.html')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(_loads(response.data)['success'])
+        self.assertFalse(delete_file.exists())
+    
+    def test_delete_file_route_missing(self):
+        """存在しないファイルでのdelete_fileルートテスト"""
         response = self.client.delete('/delete/nonexistent.html')
-        # ファイルが存在しない場合は404または400
-        self.assertIn(response.status_code, [200, 400, 404])
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(_loads(response.data)['success'])
 
 
 class TestWebHTMLEditorAdvanced(unittest.TestCase):
     """web_html_editor.pyの高度な機能のテストクラス"""
     
-    def setUp(self):
-        """各テストの前に実行されるセットアップ"""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SECRET_KEY'] = 'test-secret-key'
+    @classmethod
+    def setUpClass(cls):
+        """テストクラスの最初に1回だけ実行されるセットアップ"""
+        cls.app = app
         
-        # 一時ディレクトリを作成
-        self.temp_dir = tempfile.mkdtemp()
-        self.app.config['UPLOAD_FOLDER'] = self.temp_dir
+        # 一時ディレクトリを作成（比較・統合するファイルは各テストで変更しないため共有する）
+        cls._class_temp = tempfile.TemporaryDirectory(dir=_TEMP_ROOT)
+        cls.temp_dir = cls._class_temp.name
+        cls.app.config['UPLOAD_FOLDER'] = cls.temp_dir
         
         # テスト用のHTMLファイルを作成
-        self.html_file1 = os.path.join(self.temp_dir, 'test1.html')
-        self.html_file2 = os.path.join(self.temp_dir, 'test2.html')
-        
-        html_content1 = """<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <title>Test 1</title>
-    <style>
-        .header { color: blue; }
-    </style>
-</head>
-<body>
-    <div id="header" class="header">
-        <h1>Header 1</h1>
-    </div>
-</body>
-</html>"""
-        
-        html_content2 = """<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <title>Test 2</title>
-    <style>
-        .header { color: red; }
-    </style>
-</head>
-<body>
-    <div id="header" class="header">
-        <h1>Header 2</h1>
-    </div>
-</body>
-</html>"""
-        
-        with open(self.html_file1, 'w', encoding='utf-8') as f:
-            f.write(html_content1)
-        
-        with open(self.html_file2, 'w', encoding='utf-8') as f:
-            f.write(html_content2)
-        
-        self.client = self.app.test_client()
+        cls.html_file1 = os.path.join(cls.temp_dir, 'test1.html')
+        cls.html_file2 = os.path.join(cls.temp_dir, 'test2.html')
+        
+        Path(cls.html_file1).write_bytes(_COMPARISON_BYTES1)
+        Path(cls.html_file2).write_bytes(_COMPARISON_BYTES2)
+        
+        # 一時ディレクトリを指定するリクエストボディ（クラスで1回だけJSONに変換する）
+        cls.directory_body = _json_body({'directory': cls.temp_dir})
+        cls.diff_body = _json_body({'directory': cls.temp_dir, 'options': _DIFF_OPTIONS})
+        cls.merge_body = _json_body({
+            'files': ['test1.html', 'test2.html'],
+            'options': _MERGE_OPTIONS,
+            'directory': cls.temp_dir
+        })
+        cls.compare_body = _json_body({'files': ['test1.html', 'test2.html'], 'directory': cls.temp_dir})
+        cls.report_body = _json_body({
+            'files': [
+                {'name': 'test1.html', 'path': str(cls.html_file1)},
+                {'name': 'test2.html', 'path': str(cls.html_file2)}
+            ]
+        })
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テストクラスの最後に1回だけ実行されるクリーンアップ"""
+        cls._class_temp.cleanup()
     
-    def tearDown(self):
-        """各テストの後に実行されるクリーンアップ"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        """各テストの前に実行されるセットアップ"""
+        self.client = _shared_client()
     
     def test_diff_analysis_route_empty_directory(self):
         """空のディレクトリでの差分検出テスト"""
         response = self.client.post('/diff-analysis',
-                                   data=json.dumps({
-                                       'directory': '',
-                                       'options': {
-                                           'structure': True,
-                                           'styles': True,
-                                           'content': True,
-                                           'attributes': True
-                                       }
-                                   }),
+                                   data=_EMPTY_DIRECTORY_DIFF_BODY,
                                    content_type='application/json')
         # 空のディレクトリでもエラーにならないことを確認
         self.assertIn(response.status_code, [200, 400])
@@ -416,34 +464,18 @@ class TestWebHTMLEditorAdvanced(unittest.TestCase):
     def test_diff_analysis_route_with_files(self):
         """ファイルがある場合の差分検出テスト"""
         response = self.client.post('/diff-analysis',
-                                   data=json.dumps({
-                                       'directory': self.temp_dir,
-                                       'options': {
-                                           'structure': True,
-                                           'styles': True,
-                                           'content': True,
-                                           'attributes': True
-                                       }
-                                   }),
+                                   data=self.diff_body,
                                    content_type='application/json')
         # ファイルがある場合は200を期待
         self.assertIn(response.status_code, [200, 400])
         if response.status_code == 200:
-            data = json.loads(response.data)
+            data = _loads(response.data)
             self.assertIn('success', data)
     
     def test_template_merge_route_no_files(self):
         """ファイルが選択されていない場合のテンプレート統合テスト"""
         response = self.client.post('/template-merge',
-                                   data=json.dumps({
-                                       'files': [],
-                                       'options': {
-                                           'merge_html': True,
-                                           'merge_css': True,
-                                           'merge_content': True,
-                                           'merge_attributes': True
-                                       }
-                                   }),
+                                   data=_NO_FILES_MERGE_BODY,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400])
     
@@ -451,52 +483,37 @@ class TestWebHTMLEditorAdvanced(unittest.TestCase):
         """ファイルが選択されている場合のテンプレート統合テスト"""
         # ファイルは既にtemp_dirに存在するので、コピーは不要
         response = self.client.post('/template-merge',
-                                   data=json.dumps({
-                                       'files': ['test1.html', 'test2.html'],
-                                       'options': {
-                                           'merge_html': True,
-                                           'merge_css': True,
-                                           'merge_content': True,
-                                           'merge_attributes': True
-                                       },
-                                       'directory': self.temp_dir
-                                   }),
+                                   data=self.merge_body,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400])
     
     def test_api_list_directory_files_route(self):
         """ディレクトリファイル一覧取得APIテスト"""
         response = self.client.post('/api/list-directory-files',
-                                   data=json.dumps({
-                                       'directory': self.temp_dir
-                                   }),
+                                   data=self.directory_body,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertIn('success', data)
     
     def test_api_config_route(self):
         """設定取得APIテスト"""
         response = self.client.get('/api/config')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertIn('success', data)
     
     def test_api_check_directory_route(self):
         """ディレクトリチェックAPIテスト"""
         response = self.client.post('/api/check-directory',
-                                   data=json.dumps({
-                                       'directory': self.temp_dir
-                                   }),
+                                   data=self.directory_body,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400])
     
     def test_api_load_comparison_files_route(self):
         """比較ファイル読み込みAPIテスト"""
         response = self.client.post('/api/load-comparison-files',
-                                   data=json.dumps({
-                                       'directory': self.temp_dir
-                                   }),
+                                   data=self.directory_body,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400])
     
@@ -508,22 +525,14 @@ class TestWebHTMLEditorAdvanced(unittest.TestCase):
     def test_api_compare_screens_route(self):
         """画面比較APIテスト"""
         response = self.client.post('/api/compare-screens',
-                                   data=json.dumps({
-                                       'files': ['test1.html', 'test2.html'],
-                                       'directory': self.temp_dir
-                                   }),
+                                   data=self.compare_body,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400])
     
     def test_api_export_comparison_report_route(self):
         """比較レポートエクスポートAPIテスト"""
         response = self.client.post('/api/export-comparison-report',
-                                   data=json.dumps({
-                                       'files': [
-                                           {'name': 'test1.html', 'path': str(self.html_file1)},
-                                           {'name': 'test2.html', 'path': str(self.html_file2)}
-                                       ]
-                                   }),
+                                   data=self.report_body,
                                    content_type='application/json')
         self.assertIn(response.status_code, [200, 400, 500])
 
@@ -531,74 +540,67 @@ class TestWebHTMLEditorAdvanced(unittest.TestCase):
 class TestWebHTMLEditorUniversityAPI(unittest.TestCase):
     """web_html_editor.pyの大学データ管理APIのテストクラス"""
     
-    def setUp(self):
-        """各テストの前に実行されるセットアップ"""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SECRET_KEY'] = 'test-secret-key'
+    @classmethod
+    def setUpClass(cls):
+        """テストクラスの最初に1回だけ実行されるセットアップ（データベース以外の設定）"""
+        cls.app = app
         
         # 一時ディレクトリを作成
-        self.temp_dir = tempfile.mkdtemp()
-        self.app.config['UPLOAD_FOLDER'] = self.temp_dir
+        cls._class_temp = tempfile.TemporaryDirectory(dir=_TEMP_ROOT)
+        cls.temp_dir = cls._class_temp.name
+        cls.app.config['UPLOAD_FOLDER'] = cls.temp_dir
+        
+        # 大学ごとの設定ファイルの保存先はクラスで共有する
+        # （作成直後の一時ディレクトリ内なので、存在確認なしで作成できる）
+        cls.test_config_dir = Path(cls.temp_dir) / 'university_configs'
+        cls.test_config_dir.mkdir()
+        
+        # 一時的にDB_PATHとUNIVERSITY_CONFIG_DIRを変更（DB_PATHはテストごとに設定する）
+        cls.original_db_path = web_html_editor.DB_PATH
+        cls.original_config_dir = web_html_editor.UNIVERSITY_CONFIG_DIR
+        web_html_editor.UNIVERSITY_CONFIG_DIR = cls.test_config_dir
+        
+        # スキーマと初期データはクラスで1回だけ作成し、テストごとにバックアップAPIで複製する
+        template_db_path = f'file:university_template_{id(cls)}?mode=memory&cache=shared'
+        cls.template_db = sqlite3.connect(template_db_path, uri=True)
+        web_html_editor.DB_PATH = template_db_path
+        init_database()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テストクラスの最後に1回だけ実行されるクリーンアップ"""
+        cls.template_db.close()
         
-        # データベースを初期化
-        from web_html_editor import init_database, DB_PATH, UPLOAD_DIR
-        import shutil
-        import sqlite3
-        import web_html_editor
+        # 元のパスを復元
+        web_html_editor.DB_PATH = cls.original_db_path
+        web_html_editor.UNIVERSITY_CONFIG_DIR = cls.original_config_dir
         
-        # 一時ディレクトリにデータベースを作成
-        self.test_db_path = Path(self.temp_dir) / 'university_data.db'
-        self.test_config_dir = Path(self.temp_dir) / 'university_configs'
-        self.test_config_dir.mkdir(exist_ok=True, parents=True)
+        cls._class_temp.cleanup()
+    
+    def setUp(self):
+        """各テストの前に実行されるセットアップ（テストごとに空のデータベースを用意する）"""
+        # データベースはファイルを作らずメモリ上に作成する（テストごとに別のデータベースを使う）
+        self.test_db_path = f'file:university_data_{id(self)}?mode=memory&cache=shared'
         
-        # 一時的にDB_PATHとUNIVERSITY_CONFIG_DIRを変更
-        self.original_db_path = web_html_editor.DB_PATH
-        self.original_config_dir = web_html_editor.UNIVERSITY_CONFIG_DIR
+        # ルートの接続を閉じてもデータベースが破棄されないよう、テスト終了まで接続を保持する
+        self.db_keepalive = sqlite3.connect(self.test_db_path, uri=True)
         web_html_editor.DB_PATH = self.test_db_path
-        web_html_editor.UNIVERSITY_CONFIG_DIR = self.test_config_dir
         
-        # データベースを初期化
-        init_database()
-        self.client = self.app.test_client()
+        # 初期化済みのテンプレートをコピーしてデータベースを初期化
+        self.template_db.backup(self.db_keepalive)
+        self.client = _shared_client()
     
     def tearDown(self):
         """各テストの後に実行されるクリーンアップ"""
-        import shutil
-        import sqlite3
-        import time
-        import web_html_editor
-        
-        # データベース接続を閉じる
-        try:
-            if hasattr(self, 'test_db_path') and os.path.exists(self.test_db_path):
-                # 接続が閉じられるまで待つ
-                for _ in range(10):
-                    try:
-                        os.remove(self.test_db_path)
-                        break
-                    except PermissionError:
-                        time.sleep(0.1)
-        except:
-            pass
-        
-        # 元のパスを復元
-        if hasattr(self, 'original_db_path'):
-            web_html_editor.DB_PATH = self.original_db_path
-        if hasattr(self, 'original_config_dir'):
-            web_html_editor.UNIVERSITY_CONFIG_DIR = self.original_config_dir
-        
-        if os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass
+        # 保持していた接続を閉じると、メモリ上のデータベースは破棄される
+        self.db_keepalive.close()
+        web_html_editor.DB_PATH = self.original_db_path
     
     def test_get_universities_route(self):
         """大学一覧取得APIテスト"""
         response = self.client.get('/api/universities')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('universities', data)
         self.assertIsInstance(data['universities'], list)
@@ -606,13 +608,10 @@ class TestWebHTMLEditorUniversityAPI(unittest.TestCase):
     def test_create_university_route(self):
         """大学作成APIテスト"""
         response = self.client.post('/api/universities',
-                                   data=json.dumps({
-                                       'code': 'TEST001',
-                                       'name': 'Test University'
-                                   }),
+                                   data=_UNIVERSITY_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('id', data)
     
@@ -620,40 +619,31 @@ class TestWebHTMLEditorUniversityAPI(unittest.TestCase):
         """重複した大学コードでの大学作成APIテスト"""
         # 最初の大学を作成
         self.client.post('/api/universities',
-                        data=json.dumps({
-                            'code': 'TEST001',
-                            'name': 'Test University 1'
-                        }),
+                        data=_UNIVERSITY_BODY,
                         content_type='application/json')
         
         # 同じコードで再度作成を試みる
         response = self.client.post('/api/universities',
-                                   data=json.dumps({
-                                       'code': 'TEST001',
-                                       'name': 'Test University 2'
-                                   }),
+                                   data=_DUPLICATE_UNIVERSITY_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_create_university_route_missing_fields(self):
         """必須フィールドが欠けている場合の大学作成APIテスト"""
         response = self.client.post('/api/universities',
-                                   data=json.dumps({
-                                       'code': 'TEST001'
-                                       # nameが欠けている
-                                   }),
+                                   data=_MISSING_NAME_UNIVERSITY_BODY,
                                    content_type='application/json')
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertFalse(data['success'])
     
     def test_get_page_titles_route(self):
         """ページタイトル一覧取得APIテスト"""
         response = self.client.get('/api/page-titles')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('page_titles', data)
         self.assertIsInstance(data['page_titles'], list)
@@ -662,17 +652,14 @@ class TestWebHTMLEditorUniversityAPI(unittest.TestCase):
         """大学ページ一覧取得APIテスト"""
         # まず大学を作成
         create_response = self.client.post('/api/universities',
-                                          data=json.dumps({
-                                              'code': 'TEST001',
-                                              'name': 'Test University'
-                                          }),
+                                          data=_UNIVERSITY_BODY,
                                           content_type='application/json')
-        university_id = json.loads(create_response.data)['id']
+        university_id = _loads(create_response.data)['id']
         
         # 大学のページ一覧を取得
         response = self.client.get(f'/api/university/{university_id}/pages')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertTrue(data['success'])
         self.assertIn('pages', data)
     
@@ -76,10 +76,15 @@ DB_PATH = UPLOAD_DIR / 'university_data.db'
 UNIVERSITY_CONFIG_DIR = UPLOAD_DIR / 'university_configs'
 UNIVERSITY_CONFIG_DIR.mkdir(exist_ok=True, parents=True)
 
+def _connect_db():
+    """大学データ管理用のデータベースに接続（DB_PATHが file: で始まる場合はSQLiteのURIとして開く）"""
+    db_path = str(DB_PATH)
+    return sqlite3.connect(db_path, uri=db_path.startswith('file:'))
+
 # データベースの初期化
 def init_database():
     """大学データ管理用のデータベースを初期化"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _connect_db()
     cursor = conn.cursor()
     
     # 大学マスタテーブル
@@ -10524,7 +10529,7 @@ def main():
 def get_universities():
     """大学一覧を取得"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -10547,7 +10552,7 @@ def create_university():
         if not code or not name:
             return jsonify({'success': False, 'error': '大学コードと名前は必須です'}), 400
         
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -10569,7 +10574,7 @@ def create_university():
 def get_page_titles():
     """ページタイトル一覧を取得"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -10585,7 +10590,7 @@ def get_page_titles():
 def get_university_pages(university_id):
     """大学のページデータ一覧を取得"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -10608,7 +10613,7 @@ def get_university_pages(university_id):
 def manage_university_page(university_id, page_title_id):
     """大学のページデータを取得・作成・更新"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         cursor = conn.cursor()
         
         if request.method == 'GET':
@@ -10689,7 +10694,7 @@ def generate_university_page():
             return jsonify({'success': False, 'error': '必要なパラメータが不足しています'}), 400
         
         # 大学データを取得
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -11039,7 +11044,7 @@ def generate_pages_from_yaml():
         output_dir.mkdir(exist_ok=True, parents=True)
         
         # データベースから大学情報を取得
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = _connect_db()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         